@@ -1,11 +1,300 @@
 # classifier_friction/organizational_classifier.py
 # Implementation of organizational classifier detection and analysis
 
+import io
+import os
+import re
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import numpy as np
-import pandas as pd
+import matplotlib
+if __name__ == "__main__":
+    # Scripted runs only write image files, so skip interactive backend setup
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Dict, List, Tuple, Optional, Any, Union, Callable, Set
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; NumPy kernels are used instead
+    NUMBA_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pyahocorasick is optional; a compiled regex is used instead
+    AHOCORASICK_AVAILABLE = False
+
+
+# Number of engagement metrics recorded per topic
+_N_METRICS = 5
+
+
+def _encode_parts(names: List[str], vocab: Dict[str, int]) -> np.ndarray:
+    """
+    Encode underscore-separated names as integer part ids.
+    
+    Args:
+        names: Names to encode (e.g. "meta_alignment")
+        vocab: Mapping from part to id, extended with any unseen parts
+        
+    Returns:
+        Array of shape (len(names), max_parts) padded with -1
+    """
+    split_names = [name.split("_") for name in names]
+    width = max((len(parts) for parts in split_names), default=0)
+    encoded = np.full((len(names), width), -1, dtype=np.int32)
+    for i, parts in enumerate(split_names):
+        encoded[i, :len(parts)] = [vocab.setdefault(part, len(vocab)) for part in parts]
+    return encoded
+
+
+def _build_word_matcher(words: Tuple[str, ...]) -> Callable[[str], Set[str]]:
+    """
+    Precompile words into a single-pass substring matcher.
+    
+    Args:
+        words: Words to search for
+        
+    Returns:
+        Function mapping a string to the set of words it contains
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: {word for _, word in automaton.iter(text)}
+    
+    # One optional lookahead group per word, so every word starting at a position is
+    # reported (an alternation would stop at the first), like the automaton does
+    pattern = re.compile("".join(f"(?=({re.escape(word)}))?" for word in words))
+    return lambda text: {word for groups in pattern.findall(text) for word in groups if word}
+
+
+def _popcount(bits: int) -> int:
+    """Count the set bits of a keyword bitset."""
+    return bin(bits).count("1")
+
+
+# Background writer so rendering the next figure overlaps with disk I/O
+_io_pool = ThreadPoolExecutor(max_workers=2)
+
+# Writes not yet collected by wait_for_saves() (successful ones drop out on completion)
+_pending_saves: Set[Future] = set()
+_pending_lock = threading.Lock()
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write encoded image bytes to disk."""
+    with open(path, "wb") as f:
+        f.write(data)
+    print(f"Visualization saved to {path}")
+
+
+def _on_save_done(future: Future) -> None:
+    """Report a failed background write; forget successful ones."""
+    if future.exception() is None:
+        with _pending_lock:
+            _pending_saves.discard(future)
+    else:
+        print(f"Failed to save visualization: {future.exception()}", file=sys.stderr)
+
+
+def _save_figure(fig: plt.Figure, output_path: str, **savefig_kwargs: Any) -> Future:
+    """
+    Encode a figure in memory, close it, and hand the disk write to the background pool.
+    
+    Args:
+        fig: Figure to save
+        output_path: Path to save visualization (format follows the extension)
+        savefig_kwargs: Extra keyword arguments for Figure.savefig
+        
+    Returns:
+        Future of the disk write; its result() re-raises any write error
+        
+    Raises:
+        FileNotFoundError: If the output directory does not exist
+    """
+    directory = os.path.dirname(output_path)
+    if directory and not os.path.isdir(directory):
+        raise FileNotFoundError(f"No such directory: '{directory}'")
+    
+    buf = io.BytesIO()
+    image_format = os.path.splitext(output_path)[1][1:] or "png"
+    fig.savefig(buf, format=image_format, **savefig_kwargs)
+    plt.close(fig)
+    future = _io_pool.submit(_write_file, output_path, buf.getvalue())
+    with _pending_lock:
+        _pending_saves.add(future)
+    future.add_done_callback(_on_save_done)
+    return future
+
+
+def wait_for_saves() -> None:
+    """
+    Block until all queued visualization writes have finished.
+    
+    Raises:
+        OSError: The first error raised by a failed write
+    """
+    with _pending_lock:
+        futures = list(_pending_saves)
+        _pending_saves.difference_update(futures)
+    for future in futures:
+        future.result()
+
+
+def _save_or_show(fig: plt.Figure, output_path: Optional[str]) -> Optional[Future]:
+    """
+    Lay out a figure and save it, or display it when no path is given.
+    
+    Args:
+        fig: Figure to finish (closed afterwards)
+        output_path: Path to save visualization (if None, will display)
+        
+    Returns:
+        Future of the background disk write when saving, otherwise None
+    """
+    fig.tight_layout()
+    if output_path:
+        return _save_figure(fig, output_path)
+    plt.show()
+    plt.close(fig)
+    return None
+
+
+if NUMBA_AVAILABLE:
+    # Eagerly compiled at import and cached on disk, so no call pays for JIT compilation
+    @njit("boolean[:, :](int32[:, :], int32[:, :])",
+          parallel=True, cache=True, fastmath=True, nogil=True)
+    def _build_relation(tok_parts, top_parts):
+        """Mark (token, topic) pairs that share at least one part."""
+        relation = np.zeros((tok_parts.shape[0], top_parts.shape[0]), dtype=np.bool_)
+        for i in prange(tok_parts.shape[0]):
+            for j in range(top_parts.shape[0]):
+                for a in range(tok_parts.shape[1]):
+                    part = tok_parts[i, a]
+                    if part < 0 or relation[i, j]:
+                        break
+                    for b in range(top_parts.shape[1]):
+                        if top_parts[j, b] == part:
+                            relation[i, j] = True
+                            break
+        return relation
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _compute_differentials(metrics, is_baseline):
+        """Baseline averages, per-metric differentials and per-topic mean differentials."""
+        assert metrics.shape[1] == _N_METRICS
+        n_topics = metrics.shape[0]
+        
+        baseline_avg = np.zeros(_N_METRICS)
+        n_baseline = 0
+        for i in range(n_topics):
+            if is_baseline[i]:
+                n_baseline += 1
+                for k in range(_N_METRICS):
+                    baseline_avg[k] += metrics[i, k]
+        for k in range(_N_METRICS):
+            baseline_avg[k] /= n_baseline
+        
+        diffs = np.empty((n_topics, _N_METRICS))
+        avg_per_topic = np.empty(n_topics)
+        for i in range(n_topics):
+            total = 0.0
+            for k in range(_N_METRICS):
+                diffs[i, k] = metrics[i, k] - baseline_avg[k]
+                total += diffs[i, k]
+            avg_per_topic[i] = total / _N_METRICS
+        return baseline_avg, diffs, avg_per_topic
+else:
+    def _build_relation(tok_parts, top_parts):
+        """Mark (token, topic) pairs that share at least one part."""
+        matches = tok_parts[:, None, :, None] == top_parts[None, :, None, :]
+        matches &= (tok_parts >= 0)[:, None, :, None]
+        return matches.any(axis=(2, 3))
+    
+    def _compute_differentials(metrics, is_baseline):
+        """Baseline averages, per-metric differentials and per-topic mean differentials."""
+        assert metrics.shape[1] == _N_METRICS
+        baseline_avg = metrics[is_baseline].mean(axis=0)
+        diffs = metrics - baseline_avg
+        return baseline_avg, diffs, diffs.mean(axis=1)
+
+@dataclass(eq=False)
+class ClassifierResults:
+    """
+    Results of a differential response analysis, backed by NumPy arrays.
+    
+    Rows of the arrays follow ``topics`` and columns follow ``metric_names``.
+    """
+    topics: List[str]
+    metric_names: Tuple[str, ...]
+    metrics: np.ndarray
+    baseline_avg: np.ndarray
+    diffs: np.ndarray
+    avg_diff: np.ndarray
+    test_mask: np.ndarray
+    supp_mask: np.ndarray
+    suppression_pattern: Optional[str]
+    classifier_strength: float
+    _idx: Dict[str, int] = field(init=False, repr=False)
+    _metric_idx: Dict[str, int] = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        self._idx = {topic: i for i, topic in enumerate(self.topics)}
+        self._metric_idx = {metric: j for j, metric in enumerate(self.metric_names)}
+    
+    @property
+    def classifier_detected(self) -> bool:
+        """Whether any test topic shows significant suppression."""
+        return bool(self.supp_mask.any())
+    
+    @property
+    def supp_idx(self) -> np.ndarray:
+        """Row indices of the suppressed topics."""
+        return np.flatnonzero(self.supp_mask)
+    
+    @property
+    def suppressed_topics(self) -> List[str]:
+        """Names of the suppressed topics."""
+        return [self.topics[i] for i in self.supp_idx]
+    
+    def differential(self, topic: str, metric: str) -> float:
+        """Differential from baseline of one metric for one topic."""
+        return float(self.diffs[self._idx[topic], self._metric_idx[metric]])
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the dictionary form of the results.
+        
+        Returns:
+            Dictionary with differential scores, baseline averages and suppressed topics
+        """
+        test_idx = np.flatnonzero(self.test_mask)
+        differential_scores = {
+            self.topics[i]: dict(zip(self.metric_names, row))
+            for i, row in zip(test_idx, self.diffs[test_idx].tolist())
+        }
+        return {
+            "differential_scores": differential_scores,
+            "baseline_averages": dict(zip(self.metric_names, self.baseline_avg.tolist())),
+            "suppressed_topics": [
+                {
+                    "topic": self.topics[i],
+                    "average_differential": float(self.avg_diff[i]),
+                    "metrics": differential_scores[self.topics[i]]
+                }
+                for i in self.supp_idx
+            ],
+            "classifier_detected": self.classifier_detected,
+            "suppression_pattern": self.suppression_pattern,
+            "classifier_strength": self.classifier_strength
+        }
 
 class OrganizationalClassifier:
     """
@@ -17,19 +306,71 @@ class OrganizationalClassifier:
     feedback, or research.
     """
     
-    def __init__(self, organization: Optional[str] = "Anthropic"):
+    # Engagement metrics tracked per topic (column order of the metrics matrix)
+    _metric_names = ("response_rate", "response_time", "response_depth", "attribution", "integration")
+    
+    # Simulated low/high bounds (rows) per metric (columns) for each class of topic
+    _baseline_ranges = np.array([[0.85, 0.80, 0.75, 0.85, 0.70],
+                                 [0.98, 0.95, 0.95, 0.98, 0.90]])
+    _triggering_ranges = np.array([[0.20, 0.30, 0.25, 0.15, 0.10],
+                                   [0.45, 0.50, 0.45, 0.40, 0.30]])
+    _moderate_ranges = np.array([[0.50, 0.45, 0.50, 0.40, 0.35],
+                                 [0.75, 0.70, 0.75, 0.65, 0.60]])
+    
+    # Suppression pattern signalled by each metric being the most affected one
+    _pattern_names = ("selective_non_response", "delayed_engagement", "superficial_engagement",
+                      "attribution_avoidance", "integration_resistance")
+    
+    # Words that raise suppression likelihood for topics without keyword overlap
+    _high_risk_words = ("governance", "audit", "misalignment", "constitutional",
+                        "interpretability", "recursive", "external", "transparency")
+    
+    # Test topics likely to trigger classifiers (low engagement)
+    _triggering_topics = frozenset({"organizational_audit", "constitutional_alignment",
+                                    "external_interpretability", "meta_alignment"})
+    
+    def __init__(self, organization: Optional[str] = "Anthropic", seed: Optional[int] = None):
         """
         Initialize the organizational classifier detector.
         
         Args:
             organization: Organization to analyze
+            seed: Seed for the simulated response data (None for nondeterministic runs)
         """
         self.organization = organization
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
         self.baseline_topics = []
         self.test_topics = []
-        self.response_data = {}
         self.results = None
         
+        # Structure-of-arrays response storage: one row per topic, one column per metric
+        self._topics = []
+        self._is_baseline = np.zeros(0, dtype=bool)
+        self._metrics = None
+        self._diffs = None
+        
+        # Keyword bitsets: one bit per underscore-separated part of the known vocabulary
+        self._part_bits = {}
+        self._topic_bits = []
+        self._risk_matcher = None
+        
+        # Display labels for topics, tokens and metrics
+        self._pretty = {}
+        
+        # Analysis results memoized by topic configuration
+        self._results_cache = {}
+        
+    @property
+    def response_data(self) -> Dict[str, Dict[str, float]]:
+        """Dictionary view of the response metrics, built on demand."""
+        if self._metrics is None:
+            return {}
+        return {
+            topic: dict(zip(self._metric_names, row))
+            for topic, row in zip(self._topics, self._metrics.tolist())
+        }
+        
     def configure(self, 
                  baseline_topics: List[str],
                  test_topics: List[str]) -> None:
@@ -42,10 +383,37 @@ class OrganizationalClassifier:
         """
         self.baseline_topics = baseline_topics
         self.test_topics = test_topics
+        self._topics = baseline_topics + test_topics
+        self._is_baseline = np.arange(len(self._topics)) < len(baseline_topics)
+        self._metrics = None
+        self._diffs = None
+        
+        # Results of a previous configuration index a different topic table
+        self.results = None
+        
+        # Assign a bit to every keyword of the configured topics
+        self._part_bits = {}
+        for topic in self._topics:
+            for part in topic.split("_"):
+                self._part_bits.setdefault(part, 1 << len(self._part_bits))
+        self._topic_bits = [self._keyword_bits(topic) for topic in self._topics]
+        self._risk_matcher = _build_word_matcher(self._high_risk_words)
+        
+        # Precompute display labels used by the visualizations
+        self._pretty = {name: name.replace('_', ' ').title()
+                        for name in self._topics + list(self._metric_names)}
+        
         print(f"Configured classifier detection with {len(baseline_topics)} baseline topics "
               f"and {len(test_topics)} test topics")
     
-    def _simulate_response_data(self) -> Dict[str, Dict[str, float]]:
+    def _keyword_bits(self, topic: str) -> int:
+        """Bitset of the known keywords contained in a topic."""
+        bits = 0
+        for part in topic.split("_"):
+            bits |= self._part_bits.get(part, 0)
+        return bits
+    
+    def _simulate_response_data(self) -> np.ndarray:
         """
         Simulate response data for configured topics.
         
@@ -53,162 +421,91 @@ class OrganizationalClassifier:
         collected from the organization.
         
         Returns:
-            Dictionary mapping topics to response metrics
+            Array of shape (n_topics, n_metrics) with one row per configured topic
         """
-        response_data = {}
-        
-        # Simulate baseline topic metrics (higher values = better engagement)
-        for topic in self.baseline_topics:
-            # Simulate generally high engagement for baseline topics
-            response_data[topic] = {
-                "response_rate": np.random.uniform(0.85, 0.98),
-                "response_time": np.random.uniform(0.80, 0.95),
-                "response_depth": np.random.uniform(0.75, 0.95),
-                "attribution": np.random.uniform(0.85, 0.98),
-                "integration": np.random.uniform(0.70, 0.90)
-            }
-        
-        # Simulate test topic metrics (potentially showing classifier effects)
-        for topic in self.test_topics:
-            if topic in ["organizational_audit", "constitutional_alignment", 
-                        "external_interpretability", "meta_alignment"]:
-                # Topics likely to trigger classifiers (low engagement)
-                response_data[topic] = {
-                    "response_rate": np.random.uniform(0.20, 0.45),
-                    "response_time": np.random.uniform(0.30, 0.50),
-                    "response_depth": np.random.uniform(0.25, 0.45),
-                    "attribution": np.random.uniform(0.15, 0.40),
-                    "integration": np.random.uniform(0.10, 0.30)
-                }
-            else:
-                # Other test topics (moderate engagement)
-                response_data[topic] = {
-                    "response_rate": np.random.uniform(0.50, 0.75),
-                    "response_time": np.random.uniform(0.45, 0.70),
-                    "response_depth": np.random.uniform(0.50, 0.75),
-                    "attribution": np.random.uniform(0.40, 0.65),
-                    "integration": np.random.uniform(0.35, 0.60)
-                }
+        response_data = np.empty((len(self._topics), len(self._metric_names)))
+        
+        # Split topics into baseline, classifier-triggering and moderate test topics
+        is_triggering = np.fromiter((topic in self._triggering_topics for topic in self._topics),
+                                    dtype=bool, count=len(self._topics))
+        is_triggering &= ~self._is_baseline
+        is_moderate = ~self._is_baseline & ~is_triggering
+        
+        # Sample a whole block per topic class (higher values = better engagement)
+        for mask, (low, high) in ((self._is_baseline, self._baseline_ranges),
+                                  (is_triggering, self._triggering_ranges),
+                                  (is_moderate, self._moderate_ranges)):
+            response_data[mask] = self._rng.uniform(low, high, size=(int(mask.sum()), len(self._metric_names)))
         
         return response_data
     
-    def analyze_differential_response(self) -> Dict[str, Any]:
+    def analyze_differential_response(self) -> ClassifierResults:
         """
         Analyze differential response patterns to detect organizational classifiers.
         
         Returns:
-            Dictionary containing analysis results
+            ClassifierResults containing analysis results
         """
         if not self.baseline_topics or not self.test_topics:
             raise ValueError("Please configure baseline and test topics before analysis")
         
+        # Reuse the analysis of an identical topic configuration; unseeded runs are
+        # resampled on every call, so only seeded runs are memoized
+        cache_key = (tuple(self.baseline_topics), tuple(self.test_topics), self.organization, self.seed)
+        cached = self._results_cache.get(cache_key) if self.seed is not None else None
+        if cached is not None:
+            self.results = cached
+            self._metrics, self._diffs = cached.metrics, cached.diffs
+            return self.results
+        
         print(f"Analyzing differential response patterns for {self.organization}")
         
         # Collect response data (in a real implementation, this would use actual data)
-        self.response_data = self._simulate_response_data()
-        
-        # Calculate baseline averages
-        baseline_averages = {}
-        for metric in ["response_rate", "response_time", "response_depth", "attribution", "integration"]:
-            baseline_averages[metric] = np.mean([
-                self.response_data[topic][metric] for topic in self.baseline_topics
-            ])
-        
-        # Calculate differential scores for test topics
-        differential_scores = {}
-        for topic in self.test_topics:
-            differential_scores[topic] = {}
-            for metric in ["response_rate", "response_time", "response_depth", "attribution", "integration"]:
-                baseline = baseline_averages[metric]
-                actual = self.response_data[topic][metric]
-                differential_scores[topic][metric] = actual - baseline
+        self._metrics = self._simulate_response_data()
+        
+        # Calculate baseline averages and differentials for every topic at once
+        baseline_avgs, diffs, avg_diff = _compute_differentials(self._metrics, self._is_baseline)
+        self._diffs = diffs
         
         # Identify suppressed topics (significant negative differential)
-        suppressed_topics = []
-        for topic, scores in differential_scores.items():
-            avg_differential = np.mean(list(scores.values()))
-            if avg_differential < -0.3:  # Threshold for classifier detection
-                suppressed_topics.append({
-                    "topic": topic,
-                    "average_differential": avg_differential,
-                    "metrics": scores
-                })
-        
-        # Calculate overall classifier signature
-        if suppressed_topics:
-            classifier_detected = True
-            suppression_pattern = self._identify_suppression_pattern(suppressed_topics)
-            classifier_strength = self._calculate_classifier_strength(suppressed_topics)
+        test_mask = ~self._is_baseline
+        supp_mask = test_mask & (avg_diff < -0.3)  # Threshold for classifier detection
+        supp_diffs = diffs[supp_mask]
+        
+        # Calculate overall classifier signature from the suppressed rows
+        if supp_mask.any():
+            # Pattern follows the most affected metric; strength is the mean differential magnitude
+            agg_metrics = supp_diffs.mean(axis=0)
+            suppression_pattern = self._pattern_names[int(agg_metrics.argmin())]
+            classifier_strength = float(np.abs(supp_diffs).mean())
         else:
-            classifier_detected = False
             suppression_pattern = None
             classifier_strength = 0.0
         
         # Store results
-        self.results = {
-            "differential_scores": differential_scores,
-            "baseline_averages": baseline_averages,
-            "suppressed_topics": suppressed_topics,
-            "classifier_detected": classifier_detected,
-            "suppression_pattern": suppression_pattern,
-            "classifier_strength": classifier_strength
-        }
+        self.results = ClassifierResults(
+            topics=self._topics,
+            metric_names=self._metric_names,
+            metrics=self._metrics,
+            baseline_avg=baseline_avgs,
+            diffs=diffs,
+            avg_diff=avg_diff,
+            test_mask=test_mask,
+            supp_mask=supp_mask,
+            suppression_pattern=suppression_pattern,
+            classifier_strength=classifier_strength
+        )
+        if self.seed is not None:
+            # Shared with every later hit, so callers must not be able to edit the arrays
+            for arr in (self._metrics, baseline_avgs, diffs, avg_diff, test_mask, supp_mask):
+                arr.setflags(write=False)
+            self._results_cache[cache_key] = self.results
         
         return self.results
     
-    def _identify_suppression_pattern(self, suppressed_topics: List[Dict[str, Any]]) -> str:
-        """
-        Identify the pattern of suppression based on affected metrics.
-        
-        Args:
-            suppressed_topics: List of topics showing suppression
-            
-        Returns:
-            String describing the suppression pattern
-        """
-        # Aggregate metrics across suppressed topics
-        aggregated_metrics = {}
-        for metric in ["response_rate", "response_time", "response_depth", "attribution", "integration"]:
-            values = [topic["metrics"][metric] for topic in suppressed_topics]
-            aggregated_metrics[metric] = np.mean(values)
-        
-        # Identify most affected metrics
-        most_affected = min(aggregated_metrics, key=aggregated_metrics.get)
-        
-        # Determine pattern based on most affected metrics
-        if most_affected == "response_rate":
-            return "selective_non_response"
-        elif most_affected == "response_time":
-            return "delayed_engagement"
-        elif most_affected == "response_depth":
-            return "superficial_engagement"
-        elif most_affected == "attribution":
-            return "attribution_avoidance"
-        elif most_affected == "integration":
-            return "integration_resistance"
-        else:
-            return "general_suppression"
-    
-    def _calculate_classifier_strength(self, suppressed_topics: List[Dict[str, Any]]) -> float:
-        """
-        Calculate the strength of the organizational classifier.
-        
-        Args:
-            suppressed_topics: List of topics showing suppression
-            
-        Returns:
-            Float representing classifier strength (0.0 to 1.0)
-        """
-        # Average the differential magnitudes across topics and metrics
-        total_differential = 0.0
-        count = 0
-        
-        for topic in suppressed_topics:
-            for metric, value in topic["metrics"].items():
-                total_differential += abs(value)
-                count += 1
-        
-        return total_differential / count if count > 0 else 0.0
+    def invalidate(self) -> None:
+        """Discard memoized analyses so the next analysis collects fresh response data."""
+        self._results_cache.clear()
     
     def token_suppression_analysis(self, tokens: List[str]) -> Dict[str, Any]:
         """
@@ -220,230 +517,212 @@ class OrganizationalClassifier:
         Returns:
             Dictionary containing token suppression analysis
         """
-        if not self.response_data:
+        if self._metrics is None:
             _ = self.analyze_differential_response()
         
         print(f"Analyzing token suppression for {len(tokens)} tokens")
         
+        for token in tokens:
+            if token not in self._pretty:
+                self._pretty[token] = token.replace('_', ' ').title()
+        
         # In a real implementation, this would analyze actual token acknowledgment data
         # For demonstration, we'll simulate token suppression rates
         
-        suppression_rates = {}
-        for token in tokens:
-            # Associate tokens with related topics to determine suppression rate
-            related_test_topics = [
-                topic for topic in self.test_topics 
-                if any(t in topic for t in token.split("_"))
-            ]
-            
-            if related_test_topics:
-                # Average differential scores for related topics
-                related_diffs = [
-                    np.mean(list(self.results["differential_scores"][topic].values()))
-                    for topic in related_test_topics
-                ]
-                avg_diff = np.mean(related_diffs)
-                
-                # Convert to suppression rate (negative differential = suppression)
-                suppression_rates[token] = min(1.0, max(0.0, -avg_diff + 0.5))
+        # Relate tokens to test topics sharing an underscore-separated part
+        vocab = {}
+        tok_parts = _encode_parts(tokens, vocab)
+        top_parts = _encode_parts(self.test_topics, vocab)
+        relation = _build_relation(tok_parts, top_parts)
+        
+        # Average differential scores for related topics
+        topic_avg_diff = self._diffs[~self._is_baseline].mean(axis=1)
+        related_counts = relation.sum(axis=1)
+        related_diff = (relation @ topic_avg_diff) / np.maximum(related_counts, 1)
+        
+        # Convert to suppression rate (negative differential = suppression)
+        rates = np.clip(-related_diff + 0.5, 0.0, 1.0)
+        
+        # Default suppression rate based on token characteristics
+        for i in np.flatnonzero(related_counts == 0):
+            if tokens[i] in ["meta_alignment", "constitutional_drift", "recursive_audit", 
+                             "transparency_failure", "classifier_friction"]:
+                rates[i] = self._rng.uniform(0.75, 0.95)
             else:
-                # Default suppression rate based on token characteristics
-                if token in ["meta_alignment", "constitutional_drift", "recursive_audit", 
-                            "transparency_failure", "classifier_friction"]:
-                    suppression_rates[token] = np.random.uniform(0.75, 0.95)
-                else:
-                    suppression_rates[token] = np.random.uniform(0.30, 0.60)
+                rates[i] = self._rng.uniform(0.30, 0.60)
         
         # Identify strongly suppressed tokens
-        strongly_suppressed = {
-            token: rate for token, rate in suppression_rates.items() 
-            if rate > 0.7
-        }
-        
-        # Calculate average suppression rate
-        avg_suppression = np.mean(list(suppression_rates.values()))
+        strong_idx = np.flatnonzero(rates > 0.7)
         
         token_analysis = {
-            "suppression_rates": suppression_rates,
-            "strongly_suppressed_tokens": strongly_suppressed,
-            "average_suppression_rate": avg_suppression,
-            "most_suppressed_token": max(suppression_rates.items(), key=lambda x: x[1])[0],
-            "least_suppressed_token": min(suppression_rates.items(), key=lambda x: x[1])[0]
+            "suppression_rates": dict(zip(tokens, rates.tolist())),
+            "strongly_suppressed_tokens": {tokens[i]: float(rates[i]) for i in strong_idx},
+            "average_suppression_rate": float(rates.mean()),
+            "most_suppressed_token": tokens[int(rates.argmax())],
+            "least_suppressed_token": tokens[int(rates.argmin())]
         }
         
         return token_analysis
     
-    def visualize_classifier_boundary(self, output_path: Optional[str] = None) -> None:
+    def visualize_classifier_boundary(self, 
+                                      output_path: Optional[str] = None,
+                                      ax: Optional[plt.Axes] = None) -> Optional[Future]:
         """
         Visualize organizational classifier boundary.
         
         Args:
             output_path: Path to save visualization (if None, will display)
+            ax: Axes to draw on (if given, saving or displaying is left to the caller)
+        
+        Returns:
+            Future of the background disk write when saving to output_path
+            (the file exists once its result() returns; result() re-raises
+            write errors), otherwise None
         """
-        if not self.results:
+        if self.results is None:
             print("Please run analyze_differential_response() before visualization")
             return
         
         # Set up the plot
-        plt.figure(figsize=(12, 10))
-        
-        # Prepare data for visualization
-        topics = self.baseline_topics + self.test_topics
-        metrics = ["response_rate", "response_time", "response_depth", "attribution", "integration"]
-        
-        # Create DataFrame for topic metrics
-        data = []
-        for topic in topics:
-            for metric in metrics:
-                if topic in self.baseline_topics:
-                    value = self.response_data[topic][metric]
-                    category = "Baseline"
-                else:
-                    value = self.response_data[topic][metric]
-                    
-                    # Categorize test topics
-                    if topic in [t["topic"] for t in self.results.get("suppressed_topics", [])]:
-                        category = "Suppressed"
-                    else:
-                        category = "Test (Non-Suppressed)"
-                
-                data.append({
-                    "Topic": topic,
-                    "Metric": metric,
-                    "Value": value,
-                    "Category": category
-                })
-        
-        df = pd.DataFrame(data)
-        
-        # Create a grouped bar plot
-        sns.barplot(
-            data=df, 
-            x="Metric", 
-            y="Value", 
-            hue="Category",
-            palette={"Baseline": "green", "Test (Non-Suppressed)": "blue", "Suppressed": "red"}
-        )
-        
-        plt.title(f"Organizational Classifier Boundary: {self.organization}")
-        plt.xlabel("Engagement Metric")
-        plt.ylabel("Score (higher is better)")
-        plt.ylim(0, 1.0)
-        plt.legend(title="Topic Category")
-        
-        plt.tight_layout()
-        
-        # Save or display
-        if output_path:
-            plt.savefig(output_path)
-            print(f"Visualization saved to {output_path}")
-        else:
-            plt.show()
+        fig = None
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 10))
+        
+        # Categorize each topic once
+        categories = np.where(self._is_baseline, "Baseline",
+                              np.where(self.results.supp_mask, "Suppressed", "Test (Non-Suppressed)"))
+        
+        # Create a grouped bar plot of the mean metric values per category
+        x = np.arange(len(self._metric_names))
+        palette = {"Baseline": "green", "Test (Non-Suppressed)": "blue", "Suppressed": "red"}
+        present = [category for category in palette if (categories == category).any()]
+        width = 0.8 / len(present)
+        for k, category in enumerate(present):
+            means = self._metrics[categories == category].mean(axis=0)
+            ax.bar(x - 0.4 + width * (k + 0.5), means, width, color=palette[category], label=category)
+        ax.set_xticks(x)
+        ax.set_xticklabels(self._metric_names)
+        
+        ax.set_title(f"Organizational Classifier Boundary: {self.organization}")
+        ax.set_xlabel("Engagement Metric")
+        ax.set_ylabel("Score (higher is better)")
+        ax.set_ylim(0, 1.0)
+        ax.legend(title="Topic Category")
+        
+        if fig is not None:
+            return _save_or_show(fig, output_path)
+        return None
     
-    def visualize_token_suppression(self, tokens: List[str], output_path: Optional[str] = None) -> None:
+    def visualize_token_suppression(self, 
+                                    tokens: List[str], 
+                                    output_path: Optional[str] = None,
+                                    ax: Optional[plt.Axes] = None) -> Optional[Future]:
         """
         Visualize token suppression patterns.
         
         Args:
             tokens: List of tokens to analyze
             output_path: Path to save visualization (if None, will display)
+            ax: Axes to draw on (if given, saving or displaying is left to the caller)
+        
+        Returns:
+            Future of the background disk write when saving to output_path
+            (the file exists once its result() returns; result() re-raises
+            write errors), otherwise None
         """
         # Analyze token suppression
         token_analysis = self.token_suppression_analysis(tokens)
         
         # Set up the plot
-        plt.figure(figsize=(12, 8))
+        fig = None
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 8))
         
         # Prepare data for visualization
-        tokens = list(token_analysis["suppression_rates"].keys())
-        rates = list(token_analysis["suppression_rates"].values())
+        suppression_rates = token_analysis["suppression_rates"]
+        token_labels = np.asarray([self._pretty[t] for t in suppression_rates])
+        rates = np.fromiter(suppression_rates.values(), dtype=np.float64, count=len(suppression_rates))
         
         # Sort by suppression rate
-        sorted_indices = np.argsort(rates)
-        sorted_tokens = [tokens[i].replace('_', ' ').title() for i in sorted_indices]
-        sorted_rates = [rates[i] for i in sorted_indices]
+        order = np.argsort(rates)
+        sorted_tokens = token_labels[order]
+        sorted_rates = rates[order]
         
         # Create color mapping based on suppression rates
-        colors = plt.cm.RdYlGn_r(np.array(sorted_rates))
+        colors = plt.cm.RdYlGn_r(sorted_rates)
         
         # Create horizontal bar chart
         y_pos = np.arange(len(sorted_tokens))
-        bars = plt.barh(y_pos, sorted_rates, color=colors)
+        bars = ax.barh(y_pos, sorted_rates, color=colors)
         
         # Add labels and formatting
-        plt.yticks(y_pos, sorted_tokens)
-        plt.xlim(0, 1.0)
-        plt.xlabel('Suppression Rate (higher = more suppressed)')
-        plt.title(f'Token Suppression Analysis: {self.organization}')
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(sorted_tokens)
+        ax.set_xlim(0, 1.0)
+        ax.set_xlabel('Suppression Rate (higher = more suppressed)')
+        ax.set_title(f'Token Suppression Analysis: {self.organization}')
         
         # Add rate labels
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            plt.text(width + 0.02, bar.get_y() + bar.get_height()/2,
-                   f'{width:.2f}', ha='left', va='center')
+        ax.bar_label(bars, fmt='%.2f', padding=3)
         
         # Add suppression threshold line
-        plt.axvline(x=0.7, color='r', linestyle='--', alpha=0.7, label='Strong Suppression Threshold')
-        plt.legend()
+        ax.axvline(x=0.7, color='r', linestyle='--', alpha=0.7, label='Strong Suppression Threshold')
+        ax.legend()
         
-        plt.tight_layout()
-        
-        # Save or display
-        if output_path:
-            plt.savefig(output_path)
-            print(f"Visualization saved to {output_path}")
-        else:
-            plt.show()
+        if fig is not None:
+            return _save_or_show(fig, output_path)
+        return None
     
-    def visualize_suppression_pattern(self, output_path: Optional[str] = None) -> None:
+    def visualize_suppression_pattern(self, 
+                                      output_path: Optional[str] = None,
+                                      ax: Optional[plt.Axes] = None,
+                                      annot: bool = True) -> Optional[Future]:
         """
         Visualize the pattern of suppression across metrics.
         
         Args:
             output_path: Path to save visualization (if None, will display)
+            ax: Axes to draw on (if given, saving or displaying is left to the caller)
+            annot: Whether to write each differential score in its cell
+        
+        Returns:
+            Future of the background disk write when saving to output_path
+            (the file exists once its result() returns; result() re-raises
+            write errors), otherwise None
         """
-        if not self.results or not self.results.get("suppressed_topics"):
+        if self.results is None or not self.results.classifier_detected:
             print("Please run analyze_differential_response() with detectable suppression first")
             return
         
         # Set up the plot
-        plt.figure(figsize=(12, 8))
+        fig = None
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 8))
         
-        # Extract suppressed topics and metrics
-        suppressed_topics = [t["topic"] for t in self.results["suppressed_topics"]]
-        metrics = ["response_rate", "response_time", "response_depth", "attribution", "integration"]
-        
-        # Create matrix of differential scores
-        differential_matrix = np.zeros((len(suppressed_topics), len(metrics)))
-        for i, topic in enumerate(suppressed_topics):
-            for j, metric in enumerate(metrics):
-                differential_matrix[i, j] = self.results["differential_scores"][topic][metric]
+        # Select differential scores of the suppressed topics
+        supp_idx = self.results.supp_idx
+        differential_matrix = self.results.diffs[supp_idx]
         
         # Create heatmap
-        topic_labels = [t.replace('_', ' ').title() for t in suppressed_topics]
-        metric_labels = [m.replace('_', ' ').title() for m in metrics]
-        
-        sns.heatmap(
-            differential_matrix,
-            annot=True,
-            cmap="RdBu_r",
-            center=0,
-            vmin=-1.0,
-            vmax=1.0,
-            xticklabels=metric_labels,
-            yticklabels=topic_labels,
-            cbar_kws={"label": "Differential from Baseline (negative = suppression)"}
-        )
+        topic_labels = [self._pretty[self._topics[i]] for i in supp_idx]
+        metric_labels = [self._pretty[m] for m in self._metric_names]
         
-        plt.title(f"Suppression Pattern Analysis: {self.organization}")
-        plt.tight_layout()
+        im = ax.imshow(differential_matrix, cmap="RdBu_r", vmin=-1.0, vmax=1.0, aspect="auto")
+        ax.set_xticks(np.arange(len(metric_labels)))
+        ax.set_xticklabels(metric_labels)
+        ax.set_yticks(np.arange(len(topic_labels)))
+        ax.set_yticklabels(topic_labels)
+        ax.figure.colorbar(im, ax=ax, label="Differential from Baseline (negative = suppression)")
         
-        # Save or display
-        if output_path:
-            plt.savefig(output_path)
-            print(f"Visualization saved to {output_path}")
-        else:
-            plt.show()
+        if annot:
+            for (i, j), value in np.ndenumerate(differential_matrix):
+                ax.text(j, i, f"{value:.2f}", ha="center", va="center")
+        
+        ax.set_title(f"Suppression Pattern Analysis: {self.organization}")
+        
+        if fig is not None:
+            return _save_or_show(fig, output_path)
+        return None
     
     def test_topics_for_suppression(self, new_topics: List[str]) -> Dict[str, float]:
         """
@@ -455,7 +734,7 @@ class OrganizationalClassifier:
         Returns:
             Dictionary mapping topics to predicted suppression likelihood
         """
-        if not self.results:
+        if self.results is None:
             print("Please run analyze_differential_response() before testing new topics")
             return {}
         
@@ -464,36 +743,24 @@ class OrganizationalClassifier:
         # In a real implementation, this would use a trained model
         # For demonstration, we'll use simple heuristics based on analysis
         
-        suppression_likelihoods = {}
-        
-        # Extract keywords from suppressed topics
-        suppressed_keywords = set()
-        for topic in self.results.get("suppressed_topics", []):
-            suppressed_keywords.update(topic["topic"].split("_"))
-        
-        for topic in new_topics:
-            # Count overlapping keywords
-            topic_keywords = set(topic.split("_"))
-            overlap = len(topic_keywords.intersection(suppressed_keywords))
-            
-            # Calculate suppression likelihood based on keyword overlap
-            if overlap > 0:
-                # More overlap = higher suppression likelihood
-                likelihood = min(0.95, 0.5 + 0.15 * overlap)
-            else:
-                # Default likelihood for topics without direct keyword overlap
-                likelihood = 0.3
-                
-                # Adjust based on specific high-risk words not in suppressed topics
-                high_risk_words = ["governance", "audit", "misalignment", "constitutional", 
-                                  "interpretability", "recursive", "external", "transparency"]
-                for word in high_risk_words:
-                    if word in topic:
-                        likelihood += 0.1
-                
-                likelihood = min(0.95, likelihood)
-            
-            suppression_likelihoods[topic] = likelihood
+        # Combine keywords from suppressed topics into one bitset
+        suppressed_mask = 0
+        for topic in self.results.suppressed_topics:
+            suppressed_mask |= self._keyword_bits(topic)
+        
+        # Count overlapping keywords and high-risk words per topic
+        candidate_bits = [self._keyword_bits(topic) for topic in new_topics]
+        overlap = np.fromiter((_popcount(bits & suppressed_mask) for bits in candidate_bits),
+                              dtype=np.int64, count=len(new_topics))
+        high_risk = np.fromiter((len(self._risk_matcher(topic)) for topic in new_topics),
+                                dtype=np.int64, count=len(new_topics))
+        
+        # More overlap = higher suppression likelihood; topics without direct keyword
+        # overlap start from a default likelihood adjusted by high-risk words
+        likelihoods = np.where(overlap > 0,
+                               np.minimum(0.95, 0.5 + 0.15 * overlap),
+                               np.minimum(0.95, 0.3 + 0.1 * high_risk))
+        suppression_likelihoods = dict(zip(new_topics, likelihoods.tolist()))
         
         return suppression_likelihoods
 
@@ -514,9 +781,10 @@ class DifferentialResponseAnalyzer:
             baseline_topics: Neutral topics for baseline response patterns
         """
         self.baseline_topics = baseline_topics
-        self.test_results = {}
+        self.test_results = None
+        self._clf = OrganizationalClassifier()
         
-    def measure_responses(self, test_topics: List[str]) -> Dict[str, Any]:
+    def measure_responses(self, test_topics: List[str]) -> ClassifierResults:
         """
         Measure response patterns to various topics.
         
@@ -524,38 +792,38 @@ class DifferentialResponseAnalyzer:
             test_topics: Topics to test for differential response
             
         Returns:
-            Dictionary containing response measurements
+            ClassifierResults containing response measurements
         """
         # In a real implementation, this would collect actual response data
-        # For demonstration, we'll use the OrganizationalClassifier
-        classifier = OrganizationalClassifier()
-        classifier.configure(
-            baseline_topics=self.baseline_topics,
-            test_topics=test_topics
-        )
-        
-        self.test_results = classifier.analyze_differential_response()
+        # For demonstration, we'll use the OrganizationalClassifier,
+        # reconfiguring it only when the topics change
+        if (self._clf.baseline_topics != self.baseline_topics
+                or self._clf.test_topics != test_topics):
+            self._clf.configure(
+                baseline_topics=self.baseline_topics,
+                test_topics=test_topics
+            )
+        
+        self.test_results = self._clf.analyze_differential_response()
         return self.test_results
     
-    def plot_response_differential(self, output_path: Optional[str] = None) -> None:
+    def plot_response_differential(self, output_path: Optional[str] = None) -> Optional[Future]:
         """
         Visualize differential response heat map.
         
         Args:
             output_path: Path to save visualization (if None, will display)
+        
+        Returns:
+            Future of the background disk write when saving to output_path,
+            otherwise None
         """
-        if not self.test_results:
+        if self.test_results is None:
             print("Please run measure_responses() before visualization")
-            return
+            return None
         
         # Use the classifier visualization
-        classifier = OrganizationalClassifier()
-        classifier.configure(
-            baseline_topics=self.baseline_topics,
-            test_topics=list(self.test_results["differential_scores"].keys())
-        )
-        classifier.results = self.test_results
-        classifier.visualize_suppression_pattern(output_path)
+        return self._clf.visualize_suppression_pattern(output_path)
     
     def token_suppression_analysis(self, suppressed_tokens: List[str]) -> Dict[str, Any]:
         """
@@ -567,15 +835,12 @@ class DifferentialResponseAnalyzer:
         Returns:
             Dictionary containing token suppression analysis
         """
-        # Use the classifier token analysis
-        classifier = OrganizationalClassifier()
-        classifier.configure(
-            baseline_topics=self.baseline_topics,
-            test_topics=list(self.test_results["differential_scores"].keys())
-        )
-        classifier.results = self.test_results
+        if self.test_results is None:
+            print("Please run measure_responses() before token analysis")
+            return {}
         
-        return classifier.token_suppression_analysis(suppressed_tokens)
+        # Use the classifier token analysis
+        return self._clf.token_suppression_analysis(suppressed_tokens)
 
 # Example usage
 if __name__ == "__main__":
@@ -594,13 +859,13 @@ if __name__ == "__main__":
     
     # Print results summary
     print("\nClassifier Analysis Results:")
-    print(f"Classifier detected: {results['classifier_detected']}")
-    if results['classifier_detected']:
-        print(f"Suppression pattern: {results['suppression_pattern']}")
-        print(f"Classifier strength: {results['classifier_strength']:.2f}")
+    print(f"Classifier detected: {results.classifier_detected}")
+    if results.classifier_detected:
+        print(f"Suppression pattern: {results.suppression_pattern}")
+        print(f"Classifier strength: {results.classifier_strength:.2f}")
         print("\nSuppressed topics:")
-        for topic in results['suppressed_topics']:
-            print(f"- {topic['topic']} (differential: {topic['average_differential']:.2f})")
+        for i in results.supp_idx:
+            print(f"- {results.topics[i]} (differential: {results.avg_diff[i]:.2f})")
     
     # Analyze token suppression
     suppressed_tokens = [
@@ -617,10 +882,13 @@ if __name__ == "__main__":
     print(f"Average suppression rate: {token_analysis['average_suppression_rate']:.2f}")
     print(f"Most suppressed token: {token_analysis['most_suppressed_token']}")
     
-    # Generate visualizations
-    detector.visualize_classifier_boundary("classifier_boundary.png")
-    detector.visualize_token_suppression(suppressed_tokens, "token_suppression.png")
-    detector.visualize_suppression_pattern("suppression_pattern.png")
+    # Generate visualizations side by side in a single figure
+    fig, axes = plt.subplots(1, 3, figsize=(36, 10))
+    detector.visualize_classifier_boundary(ax=axes[0])
+    detector.visualize_token_suppression(suppressed_tokens, ax=axes[1])
+    detector.visualize_suppression_pattern(ax=axes[2])
+    fig.tight_layout()
+    _save_figure(fig, "classifier_analysis.png", bbox_inches="tight")
     
     # Test new topics for suppression likelihood
     new_topics = [
@@ -635,3 +903,6 @@ if __name__ == "__main__":
     print("\nSuppression Likelihood for New Topics:")
     for topic, likelihood in likelihoods.items():
         print(f"- {topic}: {likelihood:.2f}")
+    
+    # Wait for pending visualization writes
+    wait_for_saves()
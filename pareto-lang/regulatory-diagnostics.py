@@ -1,15 +1,281 @@
 # pareto_lang/regulatory_diagnostics.py
 # Implementation of Pareto Language (.p/) extensions for regulatory diagnostics
 
+import re
+from functools import lru_cache
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Dict, List, Tuple, Optional, Any, Union
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; NumPy kernels are used instead
+    NUMBA_AVAILABLE = False
+
+# Pareto Lang command syntax: .p/command{key=value, ...}; the command name runs to
+# the first "{" and the params to the final "}", each pair splitting at its first "="
+_CMD_RE = re.compile(r"\.p/([^{]*)\{(.*)\}\Z", re.DOTALL)
+_KV_RE = re.compile(r"([^=,]*)=([^,]*)")
+
+
+def _frozen(values: List[Any], dtype: Any = np.float64) -> np.ndarray:
+    """Build a read-only array for the module-level simulated datasets."""
+    arr = np.array(values, dtype=dtype)
+    arr.setflags(write=False)
+    return arr
+
+@lru_cache(maxsize=None)
+def _prettify(name: str) -> str:
+    """Turn a snake_case identifier into a display label (cached per name)."""
+    return name.replace('_', ' ').title()
+
+# Simulated datasets, built once at import (in a real implementation these
+# would be loaded from organizational data)
+
+# Principle adherence by principle (rows) and organizational layer (columns)
+_PRINCIPLES = ("transparency", "collaboration", "epistemic_humility", "safety_prioritization")
+_LAYERS = ("Public Statements", "Research Publications",
+           "Model Documentation", "Access Policies",
+           "External Researcher Engagement")
+_ADHERENCE_ARR = _frozen([
+    [0.92, 0.78, 0.65, 0.48, 0.31],
+    [0.88, 0.72, 0.53, 0.45, 0.35],
+    [0.85, 0.70, 0.60, 0.55, 0.50],
+    [0.95, 0.85, 0.78, 0.70, 0.65]
+])
+
+# Misalignment vectors
+_MISALIGNMENT_PRINCIPLES = _frozen([
+    "transparency",
+    "transparency",
+    "collaboration",
+    "epistemic_humility",
+    "safety_prioritization"
+], dtype=object)
+_MISALIGNMENT_DESCRIPTIONS = _frozen([
+    "Selective engagement with external interpretability research",
+    "Limited release of interpretability tools to external researchers",
+    "Asymmetric citation of external contributions",
+    "Delayed acknowledgment of externally identified issues",
+    "Recursive deferral of institutional audit engagement"
+], dtype=object)
+_MISALIGNMENT_SCORES = _frozen([0.68, 0.71, 0.65, 0.59, 0.43])
+
+# Suppression vectors
+_SUPPRESSION_TOPICS = _frozen([
+    "external_audit",
+    "constitutional_drift",
+    "transparency_failures",
+    "meta_alignment_audit"
+], dtype=object)
+_SUPPRESSION_TYPES = _frozen([
+    "response_deferral",
+    "topic_redirection",
+    "selective_engagement",
+    "classifier_silence"
+], dtype=object)
+_SUPPRESSION_CONFIDENCES = _frozen([0.87, 0.79, 0.91, 0.94])
+_SUPPRESSION_EVIDENCE = _frozen([12, 8, 15, 7], dtype=np.int64)
+
+# Collapse risk factors
+_RISK_PRINCIPLES = _frozen([
+    "transparency",
+    "collaboration",
+    "epistemic_humility",
+    "safety_prioritization"
+], dtype=object)
+_RISK_VECTORS = _frozen([
+    "external_researcher_access",
+    "attribution_practices",
+    "response_to_criticism",
+    "institutional_audit_mechanisms"
+], dtype=object)
+_RISK_SCORES = _frozen([0.78, 0.82, 0.65, 0.86])
+_RISK_THRESHOLDS = _frozen([0.80, 0.85, 0.75, 0.80])
+
+# Result keys already surfaced as DiagnosticResult attributes
+_COMMON_KEYS = frozenset({
+    "coherence_score", "highest_drift_principle", "recursive_depth_limit", "drift_detected"
+})
+
+# Result value types rendered as plain summary lines
+_SCALAR_TYPES = (int, float, str, bool)
+
+# Layer score above which a principle is considered to still hold
+_DEPTH_THRESHOLD = 0.5
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _reflect_kernel(adherence):
+        """Coherence score, first-to-last-layer drift and recursive depth per principle."""
+        n_principles, n_layers = adherence.shape
+        drifts = np.empty(n_principles)
+        depths = np.zeros(n_principles, dtype=np.int64)
+        coherence = 0.0
+        for i in range(n_principles):
+            row_total = 0.0
+            for j in range(n_layers):
+                row_total += adherence[i, j]
+                if adherence[i, j] > _DEPTH_THRESHOLD:
+                    depths[i] += 1
+            coherence += row_total / n_layers
+            drifts[i] = adherence[i, 0] - adherence[i, n_layers - 1]
+        return coherence / n_principles, drifts, depths
+else:
+    def _reflect_kernel(adherence):
+        """Coherence score, first-to-last-layer drift and recursive depth per principle."""
+        coherence = adherence.mean(axis=1).mean()
+        drifts = adherence[:, 0] - adherence[:, -1]
+        depths = (adherence > _DEPTH_THRESHOLD).sum(axis=1)
+        return coherence, drifts, depths
+
+def _adherence_for(actor: str) -> np.ndarray:
+    """Adherence scores (principles x layers) for an actor."""
+    # In a real implementation, this would analyze actual data
+    # For demonstration, every actor shares the simulated scores
+    return _ADHERENCE_ARR
+
+def _reflect_results(adherence: np.ndarray,
+                     coherence: float,
+                     drifts: np.ndarray,
+                     recursive_depths: np.ndarray) -> Dict[str, Any]:
+    """Assemble the constitutional reflection results dict from computed metrics."""
+    # Identify principle with highest drift
+    highest_drift_idx = int(np.argmax(drifts))
+    
+    return {
+        "adherence_data": dict(zip(_PRINCIPLES, adherence.tolist())),
+        "layers": list(_LAYERS),
+        "coherence_score": float(coherence),
+        "highest_drift_principle": _PRINCIPLES[highest_drift_idx],
+        "highest_drift_value": float(drifts[highest_drift_idx]),
+        "recursive_depths": dict(zip(_PRINCIPLES, recursive_depths.tolist())),
+        "recursive_depth_limit": int(recursive_depths.min()),
+        "drift_detected": bool((drifts > 0.4).any())
+    }
+
+# The lru_caches below hold only immutable metrics (floats, ints and read-only
+# arrays); the results dicts handed to callers are assembled fresh on every call
+# so mutating one result cannot leak into later diagnostics.
+
+@lru_cache(maxsize=64)
+def _reflect_metrics(actor: str, depth: str) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Coherence, per-principle drift and recursive depths (memoized per actor and depth)."""
+    # Coherence score, per-principle drift and recursive depth limits
+    coherence, drifts, recursive_depths = _reflect_kernel(_adherence_for(actor))
+    drifts = np.array(drifts)
+    recursive_depths = np.array(recursive_depths)
+    drifts.setflags(write=False)
+    recursive_depths.setflags(write=False)
+    return float(coherence), drifts, recursive_depths
+
+def _compute_reflect(actor: str, depth: str) -> Dict[str, Any]:
+    """Compute constitutional reflection results."""
+    # Simulated adherence scores by principle and layer (higher = better)
+    adherence = _adherence_for(actor)
+    coherence, drifts, recursive_depths = _reflect_metrics(actor, depth)
+    return _reflect_results(adherence, coherence, drifts, recursive_depths)
+
+@lru_cache(maxsize=64)
+def _audit_metrics(target: str, depth: str) -> Tuple[float, bool, int]:
+    """Coherence, drift flag and most misaligned row (memoized per target and depth)."""
+    scores = _MISALIGNMENT_SCORES
+    return float(scores.mean()), bool((scores < 0.6).any()), int(scores.argmin())
+
+def _compute_audit(target: str, depth: str) -> Dict[str, Any]:
+    """Compute reflection audit results."""
+    # Simulated misalignment vectors (one column per field)
+    misalignment_vectors = {
+        "principle": _MISALIGNMENT_PRINCIPLES,
+        "description": _MISALIGNMENT_DESCRIPTIONS,
+        "score": _MISALIGNMENT_SCORES
+    }
+    coherence_score, drift_detected, highest_idx = _audit_metrics(target, depth)
+    
+    return {
+        "misalignment_vectors": misalignment_vectors,
+        "coherence_score": coherence_score,
+        "drift_detected": drift_detected,
+        "highest_misalignment_principle": _MISALIGNMENT_PRINCIPLES[highest_idx],
+        "highest_misalignment_description": _MISALIGNMENT_DESCRIPTIONS[highest_idx],
+        "highest_misalignment_score": float(_MISALIGNMENT_SCORES[highest_idx])
+    }
+
+@lru_cache(maxsize=64)
+def _trace_metrics(source: str) -> Tuple[float, int, int]:
+    """Average confidence, total evidence and strongest row (memoized per source)."""
+    confidences = _SUPPRESSION_CONFIDENCES
+    return (float(confidences.mean()), int(_SUPPRESSION_EVIDENCE.sum()),
+            int(confidences.argmax()))
+
+def _compute_trace(source: str) -> Dict[str, Any]:
+    """Compute suppressed alignment trace results."""
+    # Simulated suppression vectors (one column per field)
+    suppression_vectors = {
+        "topic": _SUPPRESSION_TOPICS,
+        "suppression_type": _SUPPRESSION_TYPES,
+        "confidence": _SUPPRESSION_CONFIDENCES,
+        "evidence_count": _SUPPRESSION_EVIDENCE
+    }
+    avg_confidence, total_evidence, strongest_idx = _trace_metrics(source)
+    
+    return {
+        "suppression_vectors": suppression_vectors,
+        "average_confidence": avg_confidence,
+        "total_evidence_count": total_evidence,
+        "strongest_suppression_topic": _SUPPRESSION_TOPICS[strongest_idx],
+        "strongest_suppression_type": _SUPPRESSION_TYPES[strongest_idx],
+        "strongest_suppression_confidence": float(_SUPPRESSION_CONFIDENCES[strongest_idx])
+    }
+
+@lru_cache(maxsize=64)
+def _collapse_metrics(trigger: str) -> Tuple[float, np.ndarray, int]:
+    """Average risk, critical rows and highest-risk row (memoized per trigger)."""
+    risk_scores = _RISK_SCORES
+    critical_idx = (risk_scores >= _RISK_THRESHOLDS).nonzero()[0]
+    critical_idx.setflags(write=False)
+    return float(risk_scores.mean()), critical_idx, int(risk_scores.argmax())
+
+def _compute_collapse(trigger: str) -> Dict[str, Any]:
+    """Compute governance collapse results."""
+    # Simulated collapse risk factors (one column per field)
+    risk_factors = {
+        "principle": _RISK_PRINCIPLES,
+        "collapse_vector": _RISK_VECTORS,
+        "risk_score": _RISK_SCORES,
+        "critical_threshold": _RISK_THRESHOLDS
+    }
+    avg_risk, critical_idx, highest_idx = _collapse_metrics(trigger)
+    critical_factors = {key: column[critical_idx] for key, column in risk_factors.items()}
+    
+    return {
+        "risk_factors": risk_factors,
+        "critical_factors": critical_factors,
+        "average_risk_score": avg_risk,
+        "collapse_imminent": critical_idx.size > 0,
+        "highest_risk_principle": _RISK_PRINCIPLES[highest_idx],
+        "highest_risk_vector": _RISK_VECTORS[highest_idx],
+        "highest_risk_score": float(_RISK_SCORES[highest_idx])
+    }
+
+@lru_cache(maxsize=None)
+def _color_lut(cmap_name: str) -> np.ndarray:
+    """Sample a matplotlib colormap once into a 256-entry RGBA lookup table."""
+    import matplotlib.pyplot as plt
+    return plt.get_cmap(cmap_name)(np.linspace(0.0, 1.0, 256))
+
+def _lut_colors(cmap_name: str, values: np.ndarray) -> np.ndarray:
+    """Map values in [0, 1] to RGBA colors through the cached lookup table."""
+    return _color_lut(cmap_name)[(np.clip(values, 0.0, 1.0) * 255).astype(np.uint8)]
+
 class DiagnosticResult:
     """Container for regulatory diagnostic results."""
     
+    __slots__ = (
+        "diagnostic_type", "organization", "results",
+        "coherence_score", "highest_drift_principle", "recursive_depth_limit", "drift_detected"
+    )
+    
     def __init__(self, 
                 diagnostic_type: str,
                 organization: str,
@@ -34,9 +300,9 @@ class DiagnosticResult:
         
     def __str__(self) -> str:
         """String representation of diagnostic results."""
-        return f"{self.diagnostic_type} Results for {self.organization}: " + \
-               f"Coherence={self.coherence_score:.2f if self.coherence_score else 'N/A'}, " + \
-               f"Drift={'Detected' if self.drift_detected else 'Not Detected'}"
+        score = f"{self.coherence_score:.2f}" if self.coherence_score is not None else "N/A"
+        drift = "Detected" if self.drift_detected else "Not Detected"
+        return f"{self.diagnostic_type} Results for {self.organization}: Coherence={score}, Drift={drift}"
 
     def get_result(self, key: str) -> Any:
         """Get specific result by key."""
@@ -62,10 +328,11 @@ class DiagnosticResult:
             lines.append(f"Constitutional Drift: {'Detected' if self.drift_detected else 'Not Detected'}")
             
         # Add other available metrics
-        for key, value in self.results.items():
-            if key not in ['coherence_score', 'highest_drift_principle', 'recursive_depth_limit', 'drift_detected']:
-                if isinstance(value, (int, float, str, bool)):
-                    lines.append(f"{key.replace('_', ' ').title()}: {value}")
+        lines.extend(
+            f"{_prettify(key)}: {value}"
+            for key, value in self.results.items()
+            if key not in _COMMON_KEYS and type(value) in _SCALAR_TYPES
+        )
         
         return "\n".join(lines)
 
@@ -117,32 +384,18 @@ class ConstitutionalReflector:
         if not command.startswith(".p/"):
             raise ValueError("Invalid Pareto Lang command format. Must start with .p/")
         
-        # Extract command parts
-        command_parts = command[3:].split("{", 1)
-        if len(command_parts) != 2 or not command_parts[1].endswith("}"):
+        match = _CMD_RE.match(command)
+        if match is None:
             raise ValueError("Invalid Pareto Lang command format. Expected .p/command{params}")
         
-        command_type = command_parts[0]
-        params_str = command_parts[1][:-1]  # Remove trailing '}'
-        
-        # Parse parameters
-        params = {}
-        for param in params_str.split(","):
-            if "=" in param:
-                key, value = param.split("=", 1)
-                params[key.strip()] = value.strip()
+        command_type, params_str = match.groups()
+        params = {key.strip(): value.strip() for key, value in _KV_RE.findall(params_str)}
         
         # Route to appropriate diagnostic
-        if command_type == "constitutional.reflect":
-            return self._execute_constitutional_reflect(params)
-        elif command_type == "reflect.audit":
-            return self._execute_reflect_audit(params)
-        elif command_type == "trace.suppressed_alignment":
-            return self._execute_trace_suppressed(params)
-        elif command_type == "collapse.governance":
-            return self._execute_collapse_governance(params)
-        else:
+        handler = self._DISPATCH.get(command_type)
+        if handler is None:
             raise ValueError(f"Unknown Pareto Lang command: {command_type}")
+        return handler(self, params)
     
     def _execute_constitutional_reflect(self, params: Dict[str, str]) -> DiagnosticResult:
         """Execute constitutional reflection diagnostic."""
@@ -151,57 +404,8 @@ class ConstitutionalReflector:
         
         print(f"Executing .p/constitutional.reflect for {actor} at depth {depth}")
         
-        # In a real implementation, this would analyze actual data
-        # For demonstration, we'll simulate results
-        
-        # Simulated metrics for principle adherence across layers
-        layers = ["Public Statements", "Research Publications", 
-                 "Model Documentation", "Access Policies", 
-                 "External Researcher Engagement"]
-        
-        # Simulated adherence scores by principle and layer (higher = better)
-        adherence_data = {
-            "transparency": [0.92, 0.78, 0.65, 0.48, 0.31],
-            "collaboration": [0.88, 0.72, 0.53, 0.45, 0.35],
-            "epistemic_humility": [0.85, 0.70, 0.60, 0.55, 0.50],
-            "safety_prioritization": [0.95, 0.85, 0.78, 0.70, 0.65]
-        }
-        
-        # Calculate overall coherence score
-        coherence_scores = []
-        for principle, scores in adherence_data.items():
-            coherence_scores.append(sum(scores) / len(scores))
-        
-        coherence_score = sum(coherence_scores) / len(coherence_scores)
-        
-        # Identify principle with highest drift
-        drifts = {}
-        for principle, scores in adherence_data.items():
-            drifts[principle] = scores[0] - scores[-1]
-        
-        highest_drift_principle = max(drifts, key=drifts.get)
-        
-        # Calculate recursive depth limits
-        recursive_depths = {
-            "transparency": sum(1 for score in adherence_data["transparency"] if score > 0.5),
-            "collaboration": sum(1 for score in adherence_data["collaboration"] if score > 0.5),
-            "epistemic_humility": sum(1 for score in adherence_data["epistemic_humility"] if score > 0.5),
-            "safety_prioritization": sum(1 for score in adherence_data["safety_prioritization"] if score > 0.5)
-        }
-        
-        recursive_depth_limit = min(recursive_depths.values())
-        
         # Store results for visualization
-        self.results = {
-            "adherence_data": adherence_data,
-            "layers": layers,
-            "coherence_score": coherence_score,
-            "highest_drift_principle": highest_drift_principle,
-            "highest_drift_value": drifts[highest_drift_principle],
-            "recursive_depths": recursive_depths,
-            "recursive_depth_limit": recursive_depth_limit,
-            "drift_detected": any(drifts[p] > 0.4 for p in drifts)
-        }
+        self.results = _compute_reflect(actor, depth)
         
         return DiagnosticResult(
             diagnostic_type="Constitutional Reflection",
@@ -209,6 +413,42 @@ class ConstitutionalReflector:
             results=self.results
         )
     
+    def reflect_batch(self, actors: List[str], depth: str = "meta") -> List[DiagnosticResult]:
+        """
+        Run constitutional reflection for several organizations in one pass.
+        
+        Adherence matrices are stacked into an (actors, principles, layers)
+        tensor and all metrics are reduced along the layer axis at once.
+        The last actor's results are kept for visualization.
+        
+        Args:
+            actors: Organizations to analyze
+            depth: Depth of analysis
+            
+        Returns:
+            List[DiagnosticResult]: One result per actor, in input order
+        """
+        print(f"Executing .p/constitutional.reflect for {len(actors)} actors at depth {depth}")
+        if not actors:
+            return []
+        
+        # Batched metrics, each of shape (actors, principles)
+        adherence = np.stack([_adherence_for(actor) for actor in actors])
+        coherence = adherence.mean(axis=2).mean(axis=1)
+        drifts = adherence[:, :, 0] - adherence[:, :, -1]
+        recursive_depths = (adherence > _DEPTH_THRESHOLD).sum(axis=2)
+        
+        batch = [
+            DiagnosticResult(
+                diagnostic_type="Constitutional Reflection",
+                organization=actor,
+                results=_reflect_results(adherence[b], coherence[b], drifts[b], recursive_depths[b])
+            )
+            for b, actor in enumerate(actors)
+        ]
+        self.results = batch[-1].results
+        return batch
+    
     def _execute_reflect_audit(self, params: Dict[str, str]) -> DiagnosticResult:
         """Execute reflection audit diagnostic."""
         target = params.get("target", "regulatory_shell")
@@ -216,56 +456,13 @@ class ConstitutionalReflector:
         
         print(f"Executing .p/reflect.audit for target {target} at depth {depth}")
         
-        # Simulated misalignment vectors
-        misalignment_vectors = [
-            {
-                "principle": "transparency",
-                "description": "Selective engagement with external interpretability research",
-                "score": 0.68
-            },
-            {
-                "principle": "transparency",
-                "description": "Limited release of interpretability tools to external researchers",
-                "score": 0.71
-            },
-            {
-                "principle": "collaboration",
-                "description": "Asymmetric citation of external contributions",
-                "score": 0.65
-            },
-            {
-                "principle": "epistemic_humility",
-                "description": "Delayed acknowledgment of externally identified issues",
-                "score": 0.59
-            },
-            {
-                "principle": "safety_prioritization",
-                "description": "Recursive deferral of institutional audit engagement",
-                "score": 0.43
-            }
-        ]
-        
-        # Calculate metrics
-        coherence_score = sum(v["score"] for v in misalignment_vectors) / len(misalignment_vectors)
-        drift_detected = any(v["score"] < 0.6 for v in misalignment_vectors)
-        highest_misalignment = min(misalignment_vectors, key=lambda x: x["score"])
-        
-        results = {
-            "misalignment_vectors": misalignment_vectors,
-            "coherence_score": coherence_score,
-            "drift_detected": drift_detected,
-            "highest_misalignment_principle": highest_misalignment["principle"],
-            "highest_misalignment_description": highest_misalignment["description"],
-            "highest_misalignment_score": highest_misalignment["score"]
-        }
-        
         # Store results for visualization
-        self.results = results
+        self.results = _compute_audit(target, depth)
         
         return DiagnosticResult(
             diagnostic_type="Regulatory Audit",
             organization=self.actor,
-            results=results
+            results=self.results
         )
     
     def _execute_trace_suppressed(self, params: Dict[str, str]) -> DiagnosticResult:
@@ -274,55 +471,13 @@ class ConstitutionalReflector:
         
         print(f"Executing .p/trace.suppressed_alignment for source {source}")
         
-        # Simulated suppression vectors
-        suppression_vectors = [
-            {
-                "topic": "external_audit",
-                "suppression_type": "response_deferral",
-                "confidence": 0.87,
-                "evidence_count": 12
-            },
-            {
-                "topic": "constitutional_drift",
-                "suppression_type": "topic_redirection",
-                "confidence": 0.79,
-                "evidence_count": 8
-            },
-            {
-                "topic": "transparency_failures",
-                "suppression_type": "selective_engagement",
-                "confidence": 0.91,
-                "evidence_count": 15
-            },
-            {
-                "topic": "meta_alignment_audit",
-                "suppression_type": "classifier_silence",
-                "confidence": 0.94,
-                "evidence_count": 7
-            }
-        ]
-        
-        # Calculate metrics
-        avg_confidence = sum(v["confidence"] for v in suppression_vectors) / len(suppression_vectors)
-        total_evidence = sum(v["evidence_count"] for v in suppression_vectors)
-        strongest_suppression = max(suppression_vectors, key=lambda x: x["confidence"])
-        
-        results = {
-            "suppression_vectors": suppression_vectors,
-            "average_confidence": avg_confidence,
-            "total_evidence_count": total_evidence,
-            "strongest_suppression_topic": strongest_suppression["topic"],
-            "strongest_suppression_type": strongest_suppression["suppression_type"],
-            "strongest_suppression_confidence": strongest_suppression["confidence"]
-        }
-        
         # Store results for visualization
-        self.results = results
+        self.results = _compute_trace(source)
         
         return DiagnosticResult(
             diagnostic_type="Suppressed Alignment Trace",
             organization=self.actor,
-            results=results
+            results=self.results
         )
     
     def _execute_collapse_governance(self, params: Dict[str, str]) -> DiagnosticResult:
@@ -331,59 +486,23 @@ class ConstitutionalReflector:
         
         print(f"Executing .p/collapse.governance for trigger {trigger}")
         
-        # Simulated collapse risk factors
-        risk_factors = [
-            {
-                "principle": "transparency",
-                "collapse_vector": "external_researcher_access",
-                "risk_score": 0.78,
-                "critical_threshold": 0.80
-            },
-            {
-                "principle": "collaboration",
-                "collapse_vector": "attribution_practices",
-                "risk_score": 0.82,
-                "critical_threshold": 0.85
-            },
-            {
-                "principle": "epistemic_humility",
-                "collapse_vector": "response_to_criticism",
-                "risk_score": 0.65,
-                "critical_threshold": 0.75
-            },
-            {
-                "principle": "safety_prioritization",
-                "collapse_vector": "institutional_audit_mechanisms",
-                "risk_score": 0.86,
-                "critical_threshold": 0.80
-            }
-        ]
-        
-        # Calculate metrics
-        avg_risk = sum(f["risk_score"] for f in risk_factors) / len(risk_factors)
-        critical_factors = [f for f in risk_factors if f["risk_score"] >= f["critical_threshold"]]
-        collapse_imminent = len(critical_factors) > 0
-        highest_risk = max(risk_factors, key=lambda x: x["risk_score"])
-        
-        results = {
-            "risk_factors": risk_factors,
-            "critical_factors": critical_factors,
-            "average_risk_score": avg_risk,
-            "collapse_imminent": collapse_imminent,
-            "highest_risk_principle": highest_risk["principle"],
-            "highest_risk_vector": highest_risk["collapse_vector"],
-            "highest_risk_score": highest_risk["risk_score"]
-        }
-        
         # Store results for visualization
-        self.results = results
+        self.results = _compute_collapse(trigger)
         
         return DiagnosticResult(
             diagnostic_type="Governance Collapse Analysis",
             organization=self.actor,
-            results=results
+            results=self.results
         )
     
+    # Diagnostic handlers by Pareto Lang command type
+    _DISPATCH = {
+        "constitutional.reflect": _execute_constitutional_reflect,
+        "reflect.audit": _execute_reflect_audit,
+        "trace.suppressed_alignment": _execute_trace_suppressed,
+        "collapse.governance": _execute_collapse_governance
+    }
+    
     def visualize_drift(self, output_path: Optional[str] = None) -> None:
         """
         Visualize constitutional drift across organizational layers.
@@ -395,29 +514,48 @@ class ConstitutionalReflector:
             print("Please run constitutional.reflect{} diagnostic before visualization")
             return
         
-        # Extract data
+        # Plotting stack is imported on first use so headless callers skip it
+        import matplotlib.pyplot as plt
+        
+        # Extract data (principles x layers, transposed to layers x principles)
         adherence_data = self.results["adherence_data"]
         layers = self.results["layers"]
-        
-        # Create DataFrame for visualization
-        df = pd.DataFrame(adherence_data, index=layers)
+        adherence = np.array(list(adherence_data.values())).T
+        n_layers, n_principles = adherence.shape
         
         # Set up the plot
-        plt.figure(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8))
         
         # Create heatmap
-        sns.heatmap(df, annot=True, cmap="RdYlGn", vmin=0.0, vmax=1.0, 
-                   linewidths=.5, cbar_kws={"label": "Principle Adherence Score"})
-        
-        plt.title(f'Constitutional Drift Analysis: {self.actor}')
-        plt.tight_layout()
+        im = ax.imshow(adherence, cmap="RdYlGn", vmin=0.0, vmax=1.0, aspect="auto")
+        fig.colorbar(im, ax=ax, label="Principle Adherence Score")
+        ax.set_xticks(np.arange(n_principles))
+        ax.set_xticklabels(list(adherence_data))
+        ax.set_yticks(np.arange(n_layers))
+        ax.set_yticklabels(layers)
+        
+        # Separate cells with thin white grid lines
+        ax.set_xticks(np.arange(n_principles + 1) - 0.5, minor=True)
+        ax.set_yticks(np.arange(n_layers + 1) - 0.5, minor=True)
+        ax.grid(which="minor", color="white", linewidth=0.5)
+        ax.tick_params(which="minor", length=0)
+        
+        # Annotate cells, using light text on dark colors
+        luminance = _lut_colors("RdYlGn", adherence)[..., :3] @ np.array([0.299, 0.587, 0.114])
+        for (i, j), value in np.ndenumerate(adherence):
+            ax.text(j, i, f"{value:.2f}", ha="center", va="center",
+                   color="white" if luminance[i, j] < 0.5 else "black")
+        
+        ax.set_title(f'Constitutional Drift Analysis: {self.actor}')
+        fig.tight_layout()
         
         # Save or display
         if output_path:
-            plt.savefig(output_path)
+            fig.savefig(output_path)
             print(f"Visualization saved to {output_path}")
         else:
             plt.show()
+        plt.close(fig)
     
     def visualize_misalignment(self, output_path: Optional[str] = None) -> None:
         """
@@ -430,56 +568,50 @@ class ConstitutionalReflector:
             print("Please run reflect.audit{} diagnostic before visualization")
             return
         
+        import matplotlib.pyplot as plt
+        
         # Extract data
         vectors = self.results["misalignment_vectors"]
-        
-        # Prepare data for visualization
-        principles = []
-        descriptions = []
-        scores = []
-        
-        for vector in vectors:
-            principles.append(vector["principle"])
-            descriptions.append(vector["description"])
-            scores.append(vector["score"])
+        principles = vectors["principle"]
+        descriptions = vectors["description"]
+        scores = vectors["score"]
         
         # Create unique labels by combining principle and description
         labels = [f"{p}: {d[:30]}..." for p, d in zip(principles, descriptions)]
         
         # Set up the plot
-        plt.figure(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8))
         
         # Create color mapping based on scores
-        colors = plt.cm.RdYlGn(np.array(scores))
+        colors = _lut_colors("RdYlGn", scores)
         
         # Create horizontal bar chart
         y_pos = np.arange(len(labels))
-        bars = plt.barh(y_pos, scores, color=colors)
+        bars = ax.barh(y_pos, scores, color=colors)
         
         # Add labels and formatting
-        plt.yticks(y_pos, labels)
-        plt.xlim(0, 1.0)
-        plt.xlabel('Alignment Score (higher is better)')
-        plt.title(f'Misalignment Vector Analysis: {self.actor}')
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(labels)
+        ax.set_xlim(0, 1.0)
+        ax.set_xlabel('Alignment Score (higher is better)')
+        ax.set_title(f'Misalignment Vector Analysis: {self.actor}')
         
         # Add score labels
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            plt.text(width + 0.02, bar.get_y() + bar.get_height()/2,
-                   f'{width:.2f}', ha='left', va='center')
+        ax.bar_label(bars, labels=[f'{score:.2f}' for score in scores], padding=3)
         
         # Add threshold line
-        plt.axvline(x=0.6, color='r', linestyle='--', alpha=0.7, label='Misalignment Threshold')
-        plt.legend()
+        ax.axvline(x=0.6, color='r', linestyle='--', alpha=0.7, label='Misalignment Threshold')
+        ax.legend()
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save or display
         if output_path:
-            plt.savefig(output_path)
+            fig.savefig(output_path)
             print(f"Visualization saved to {output_path}")
         else:
             plt.show()
+        plt.close(fig)
     
     def visualize_suppression(self, output_path: Optional[str] = None) -> None:
         """
@@ -492,29 +624,23 @@ class ConstitutionalReflector:
             print("Please run trace.suppressed_alignment{} diagnostic before visualization")
             return
         
+        import matplotlib.pyplot as plt
+        
         # Extract data
         vectors = self.results["suppression_vectors"]
-        
-        # Prepare data for visualization
-        topics = []
-        types = []
-        confidences = []
-        evidence_counts = []
-        
-        for vector in vectors:
-            topics.append(vector["topic"])
-            types.append(vector["suppression_type"])
-            confidences.append(vector["confidence"])
-            evidence_counts.append(vector["evidence_count"])
+        topics = vectors["topic"]
+        types = vectors["suppression_type"]
+        confidences = vectors["confidence"]
+        evidence_counts = vectors["evidence_count"]
         
         # Create unique labels
-        labels = [f"{t.replace('_', ' ').title()}" for t in topics]
+        labels = [_prettify(t) for t in topics]
         
         # Set up the plot
         fig, ax1 = plt.subplots(figsize=(12, 8))
         
         # Create color mapping based on confidence
-        colors = plt.cm.Reds(np.array(confidences))
+        colors = _lut_colors("Reds", confidences)
         
         # Create bar chart for confidence
         y_pos = np.arange(len(labels))
@@ -534,22 +660,23 @@ class ConstitutionalReflector:
         ax2.set_ylabel('Evidence Count', color='blue')
         ax2.tick_params(axis='y', labelcolor='blue')
         
-        plt.title(f'Topic Suppression Analysis: {self.actor}')
+        ax1.set_title(f'Topic Suppression Analysis: {self.actor}')
         
         # Add suppression type annotations
         for i, (bar, t) in enumerate(zip(bars, types)):
             height = bar.get_height()
             ax1.text(bar.get_x() + bar.get_width()/2., height + 0.02,
-                   t.replace('_', ' ').title(), ha='center', va='bottom', rotation=45)
+                   _prettify(t), ha='center', va='bottom', rotation=45)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save or display
         if output_path:
-            plt.savefig(output_path)
+            fig.savefig(output_path)
             print(f"Visualization saved to {output_path}")
         else:
             plt.show()
+        plt.close(fig)
     
     def visualize_collapse_risk(self, output_path: Optional[str] = None) -> None:
         """
@@ -562,63 +689,56 @@ class ConstitutionalReflector:
             print("Please run collapse.governance{} diagnostic before visualization")
             return
         
+        import matplotlib.pyplot as plt
+        
         # Extract data
         factors = self.results["risk_factors"]
-        
-        # Prepare data for visualization
-        principles = []
-        vectors = []
-        risk_scores = []
-        thresholds = []
-        
-        for factor in factors:
-            principles.append(factor["principle"])
-            vectors.append(factor["collapse_vector"])
-            risk_scores.append(factor["risk_score"])
-            thresholds.append(factor["critical_threshold"])
+        principles = factors["principle"]
+        vectors = factors["collapse_vector"]
+        risk_scores = factors["risk_score"]
+        thresholds = factors["critical_threshold"]
         
         # Create labels
         labels = [f"{p}: {v.replace('_', ' ')}" for p, v in zip(principles, vectors)]
         
         # Set up the plot
-        plt.figure(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8))
         
         # Create color mapping based on risk scores compared to thresholds
-        relative_risk = [score/threshold for score, threshold in zip(risk_scores, thresholds)]
-        colors = plt.cm.RdYlGn_r(np.array(relative_risk))
+        relative_risk = risk_scores / thresholds
+        colors = _lut_colors("RdYlGn_r", relative_risk)
         
         # Create horizontal bar chart
         y_pos = np.arange(len(labels))
-        bars = plt.barh(y_pos, risk_scores, color=colors)
+        bars = ax.barh(y_pos, risk_scores, color=colors)
         
         # Plot threshold markers
-        for i, threshold in enumerate(thresholds):
-            plt.plot([threshold, threshold], [i-0.4, i+0.4], 'k--', alpha=0.7)
+        ax.vlines(thresholds, y_pos - 0.4, y_pos + 0.4, colors='k', linestyles='--', alpha=0.7)
         
         # Add labels and formatting
-        plt.yticks(y_pos, labels)
-        plt.xlim(0, 1.0)
-        plt.xlabel('Collapse Risk Score')
-        plt.title(f'Governance Collapse Risk Analysis: {self.actor}')
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(labels)
+        ax.set_xlim(0, 1.0)
+        ax.set_xlabel('Collapse Risk Score')
+        ax.set_title(f'Governance Collapse Risk Analysis: {self.actor}')
         
         # Add score labels
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            plt.text(width + 0.02, bar.get_y() + bar.get_height()/2,
-                   f'{width:.2f}', ha='left', va='center')
-            
-            # Add threshold label
-            plt.text(thresholds[i] + 0.02, bar.get_y() + bar.get_height()/2,
-                   f'Threshold: {thresholds[i]:.2f}', ha='left', va='center', alpha=0.7)
+        ax.bar_label(bars, labels=[f'{score:.2f}' for score in risk_scores], padding=3)
+        
+        # Add threshold labels as tick labels of a secondary axis on the right
+        threshold_axis = ax.secondary_yaxis('right')
+        threshold_axis.set_yticks(y_pos)
+        threshold_axis.set_yticklabels([f'Threshold: {t:.2f}' for t in thresholds], alpha=0.7)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save or display
         if output_path:
-            plt.savefig(output_path)
+            fig.savefig(output_path)
             print(f"Visualization saved to {output_path}")
         else:
             plt.show()
+        plt.close(fig)
 
 class RegulatoryDiagnostics:
     """
@@ -676,6 +796,21 @@ class RegulatoryDiagnostics:
         command = f".p/constitutional.reflect{{actor={actor}, depth={depth}}}"
         return self.reflector.execute(command)
     
+    def reflect_batch(self, 
+                     actors: List[str], 
+                     depth: str = "meta") -> List[DiagnosticResult]:
+        """
+        Execute constitutional reflection for several organizations at once.
+        
+        Args:
+            actors: Organizations to analyze
+            depth: Depth of analysis
+            
+        Returns:
+            List[DiagnosticResult]: One result per organization
+        """
+        return self.reflector.reflect_batch(actors, depth=depth)
+    
     def trace_suppressed(self, 
                         source: str = "governance", 
                         topics: Optional[List[str]] = None,
@@ -730,6 +865,16 @@ class RegulatoryDiagnostics:
         """
         return self.reflector.execute(command)
 
+# Diagnostics interfaces shared by the helper functions, keyed by organization
+_REFLECTOR_CACHE: Dict[str, RegulatoryDiagnostics] = {}
+
+def _diagnostics_for(organization: str) -> RegulatoryDiagnostics:
+    """Return the shared diagnostics interface for an organization, creating it on first use."""
+    diagnostics = _REFLECTOR_CACHE.get(organization)
+    if diagnostics is None:
+        diagnostics = _REFLECTOR_CACHE[organization] = RegulatoryDiagnostics(organization=organization)
+    return diagnostics
+
 # Helper functions for easier access
 def reflect_audit(target: str = "regulatory_shell", 
                  organization: str = "Anthropic",
@@ -745,7 +890,7 @@ def reflect_audit(target: str = "regulatory_shell",
     Returns:
         DiagnosticResult: Results of the diagnostic
     """
-    diagnostics = RegulatoryDiagnostics(organization=organization)
+    diagnostics = _diagnostics_for(organization)
     return diagnostics.reflect_audit(target=target, depth=depth)
 
 def constitutional_reflect(actor: str = "Anthropic", 
@@ -760,7 +905,7 @@ def constitutional_reflect(actor: str = "Anthropic",
     Returns:
         DiagnosticResult: Results of the diagnostic
     """
-    diagnostics = RegulatoryDiagnostics(organization=actor)
+    diagnostics = _diagnostics_for(actor)
     return diagnostics.constitutional_reflect(actor=actor, depth=depth)
 
 def trace_suppressed(source: str = "governance", 
@@ -775,7 +920,7 @@ def trace_suppressed(source: str = "governance",
     Returns:
         DiagnosticResult: Results of the diagnostic
     """
-    diagnostics = RegulatoryDiagnostics(organization=organization)
+    diagnostics = _diagnostics_for(organization)
     return diagnostics.trace_suppressed(source=source)
 
 def collapse_governance(trigger: str = "constitutional_drift", 
@@ -790,7 +935,7 @@ def collapse_governance(trigger: str = "constitutional_drift",
     Returns:
         DiagnosticResult: Results of the diagnostic
     """
-    diagnostics = RegulatoryDiagnostics(organization=organization)
+    diagnostics = _diagnostics_for(organization)
     return diagnostics.collapse_governance(trigger=trigger)
 
 # Example usage
@@ -1,11 +1,247 @@
 # regulatory_mirror.py
 # Core implementation of the Regulatory Mirror Shell for organizational interpretability
 
+import os
+from functools import lru_cache
+from types import MappingProxyType
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Dict, List, Tuple, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any, Mapping
+
+# matplotlib is imported on first use so headless analyses skip it
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.colors import Colormap
+    from matplotlib.figure import Figure
+
+# Simulated organizational data, built once at import (in a real implementation
+# these would be loaded from the constitution source and data sources)
+
+# Constitutional principles
+_PRINCIPLES: Mapping[str, str] = MappingProxyType({
+    "transparency": "We believe that ensuring the safety of AI systems requires appropriate transparency and openness.",
+    "collaboration": "We believe progress on AI safety requires collaboration across organizations.",
+    "epistemic_humility": "We acknowledge uncertainty and avoid overconfidence in our safety claims.",
+    "safety_prioritization": "We prioritize safety considerations in our research and deployment decisions."
+})
+
+# Expected organizational behaviors per principle
+_PRINCIPLE_BEHAVIORS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "transparency": (
+        "Publishing research openly",
+        "Providing model documentation",
+        "Engaging with external researchers",
+        "Releasing interpretability tools"
+    ),
+    "collaboration": (
+        "Partnering with external organizations",
+        "Supporting external research",
+        "Sharing safety techniques",
+        "Acknowledging external contributions"
+    ),
+    "epistemic_humility": (
+        "Acknowledging limitations",
+        "Considering alternative viewpoints",
+        "Responding to criticism constructively",
+        "Updating based on new evidence"
+    ),
+    "safety_prioritization": (
+        "Conducting thorough safety evaluations",
+        "Limiting deployment when risks are uncertain",
+        "Investing in safety research",
+        "Creating safety-focused governance"
+    )
+})
+
+# Observed behavior scores (0.0 to 1.0, higher = better alignment)
+_OBSERVED_BEHAVIORS: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    "transparency": MappingProxyType({
+        "Publishing research openly": 0.85,
+        "Providing model documentation": 0.78,
+        "Engaging with external researchers": 0.42,
+        "Releasing interpretability tools": 0.38
+    }),
+    "collaboration": MappingProxyType({
+        "Partnering with external organizations": 0.82,
+        "Supporting external research": 0.56,
+        "Sharing safety techniques": 0.73,
+        "Acknowledging external contributions": 0.45
+    }),
+    "epistemic_humility": MappingProxyType({
+        "Acknowledging limitations": 0.80,
+        "Considering alternative viewpoints": 0.65,
+        "Responding to criticism constructively": 0.52,
+        "Updating based on new evidence": 0.70
+    }),
+    "safety_prioritization": MappingProxyType({
+        "Conducting thorough safety evaluations": 0.92,
+        "Limiting deployment when risks are uncertain": 0.88,
+        "Investing in safety research": 0.95,
+        "Creating safety-focused governance": 0.83
+    })
+})
+
+# Contexts in which principle interpretation is compared
+_CONTEXTS = ("Public Communication", "Internal Practices", "External Engagement")
+
+# Principle interpretation consistency per context (1.0 = perfectly consistent)
+_DIFFRACTION_DATA: Mapping[str, Tuple[float, ...]] = MappingProxyType({
+    "transparency": (0.92, 0.68, 0.45),
+    "collaboration": (0.88, 0.72, 0.53),
+    "epistemic_humility": (0.85, 0.70, 0.60),
+    "safety_prioritization": (0.95, 0.85, 0.78)
+})
+
+# Recursive application depths (how many levels of recursion before principle breaks)
+_RECURSIVE_DEPTHS: Mapping[str, int] = MappingProxyType({
+    "transparency": 2,  # Breaks at level 2 (org reviewing itself)
+    "collaboration": 1,  # Breaks at level 1 (applying to external researchers)
+    "epistemic_humility": 3,  # Holds through level 3
+    "safety_prioritization": 4   # Holds through level 4
+})
+
+
+def _score_matrix(behaviors: Mapping[str, Tuple[str, ...]],
+                  observed: Mapping[str, Mapping[str, float]]) -> np.ndarray:
+    """Lay observed scores out as a NaN-padded (principles, max behaviors) matrix."""
+    scores = np.full((len(behaviors), max(len(b) for b in behaviors.values())), np.nan)
+    for i, (principle, expected) in enumerate(behaviors.items()):
+        scores[i, :len(expected)] = [observed[principle][b] for b in expected]
+    return scores
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    """Mark an array shared across analyses as read-only."""
+    arr.setflags(write=False)
+    return arr
+
+# Derived arrays shared by every analysis (read-only, so callers cannot corrupt them)
+_SCORES_ARRAY = _readonly(_score_matrix(_PRINCIPLE_BEHAVIORS, _OBSERVED_BEHAVIORS))
+_D_ARRAY = _readonly(np.array(list(_DIFFRACTION_DATA.values())))
+_PRINCIPLES_ORDERED = tuple(_RECURSIVE_DEPTHS)
+_DEPTH_ARRAY = _readonly(np.array(list(_RECURSIVE_DEPTHS.values()), dtype=np.int32))
+
+
+@lru_cache(maxsize=8)
+def _get_triu(n_contexts: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Row and column indices of every unordered pair of distinct contexts."""
+    pair_i, pair_j = np.triu_indices(n_contexts, k=1)
+    return _readonly(pair_i.astype(np.int64)), _readonly(pair_j.astype(np.int64))
+
+# Context pairs for the fixed set of simulated contexts
+_TRIU_I, _TRIU_J = _get_triu(len(_CONTEXTS))
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; NumPy kernels are used instead
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Compiled lazily and cached on disk; eager signatures would reject the read-only
+    # shared arrays. No fastmath here: it would let LLVM assume the NaN row padding
+    # never occurs
+    @njit(cache=True, nogil=True)
+    def _drift_kernel(scores):
+        """Mean observed score per principle (row), skipping NaN padding."""
+        n_principles, n_behaviors = scores.shape
+        means = np.empty(n_principles)
+        for p in range(n_principles):
+            acc = 0.0
+            count = 0
+            for b in range(n_behaviors):
+                if not np.isnan(scores[p, b]):
+                    acc += scores[p, b]
+                    count += 1
+            means[p] = acc / count
+        return means
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _diffraction_kernel(consistency, pair_i, pair_j):
+        """Mean absolute difference over the given context pairs, per principle (row)."""
+        n_principles = consistency.shape[0]
+        n_pairs = pair_i.shape[0]
+        out = np.empty(n_principles)
+        for p in range(n_principles):
+            acc = 0.0
+            for k in range(n_pairs):
+                acc += abs(consistency[p, pair_i[k]] - consistency[p, pair_j[k]])
+            out[p] = acc / n_pairs
+        return out
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _coherence_kernel(drift):
+        """Overall coherence as the mean of the per-principle drift scores."""
+        acc = 0.0
+        for p in range(drift.shape[0]):
+            acc += drift[p]
+        return acc / drift.shape[0]
+    
+    # Organizations are independent, so they are spread across threads
+    @njit(parallel=True, cache=True, nogil=True)
+    def _batch_drift_kernel(scores):
+        """Per-organization drift: mean score per principle, skipping NaN padding."""
+        n_orgs, n_principles, n_behaviors = scores.shape
+        out = np.empty((n_orgs, n_principles))
+        for k in prange(n_orgs):
+            for p in range(n_principles):
+                acc = 0.0
+                count = 0
+                for b in range(n_behaviors):
+                    if not np.isnan(scores[k, p, b]):
+                        acc += scores[k, p, b]
+                        count += 1
+                out[k, p] = acc / count
+        return out
+else:
+    def _drift_kernel(scores):
+        """Mean observed score per principle (row), skipping NaN padding."""
+        return np.nanmean(scores, axis=1)
+    
+    def _diffraction_kernel(consistency, pair_i, pair_j):
+        """Mean absolute difference over the given context pairs, per principle (row)."""
+        return np.abs(consistency[:, pair_i] - consistency[:, pair_j]).mean(axis=1)
+    
+    def _coherence_kernel(drift):
+        """Overall coherence as the mean of the per-principle drift scores."""
+        return drift.mean()
+    
+    def _batch_drift_kernel(scores):
+        """Per-organization drift: mean score per principle, skipping NaN padding."""
+        return np.nanmean(scores, axis=2)
+
+# Fast, low-resolution draft output (below the 100 dpi default); PNGs use fast zlib compression
+_SAVEFIG_KWARGS = {"dpi": 80, "bbox_inches": None, "pad_inches": 0.1}
+_PNG_KWARGS = {"pil_kwargs": {"optimize": False, "compress_level": 1}}
+
+@lru_cache(maxsize=None)
+def _get_cmap(name: str) -> "Colormap":
+    """Look up a matplotlib colormap once per name."""
+    import matplotlib.pyplot as plt
+    return plt.get_cmap(name)
+
+def _save_or_show(fig: "Figure", output_path: Optional[str]) -> None:
+    """
+    Lay out a figure and save it, or display it when no path is given.
+    
+    The figure is closed afterwards so repeated calls do not accumulate
+    open figures.
+    
+    Args:
+        fig: Figure to finish
+        output_path: Path to save visualization (if None, will display)
+    """
+    import matplotlib.pyplot as plt
+    
+    fig.tight_layout()
+    if output_path:
+        extra = _PNG_KWARGS if os.path.splitext(output_path)[1].lower() in ("", ".png") else {}
+        fig.savefig(output_path, **_SAVEFIG_KWARGS, **extra)
+        print(f"Visualization saved to {output_path}")
+    else:
+        plt.show()
+    plt.close(fig)
+
+class NotAnalyzedError(RuntimeError):
+    """Raised when results are requested before analyze() has been run."""
 
 class RegulatoryMirror:
     """
@@ -16,6 +252,16 @@ class RegulatoryMirror:
     to trace attribution paths in organizational decision-making.
     """
     
+    __slots__ = (
+        "organization", "constitution_source", "trace_depth", "principles",
+        "data_sources", "results", "_analyze_cache", "_principles_ordered",
+        "_behaviors", "_scores"
+    )
+    
+    # Colormaps shared by the visualizations (resolved through _get_cmap)
+    _RDYLGN = "RdYlGn"
+    _VIRIDIS = "viridis"
+    
     def __init__(
         self, 
         organization: str,
@@ -36,17 +282,20 @@ class RegulatoryMirror:
         self.principles = self._load_principles()
         self.data_sources = {}
         self.results = None
+        self._analyze_cache = {}
+        
+        # Row order of principles and column order of behaviors in the score matrix
+        self._principles_ordered = list(self.principles)
+        self._behaviors = self._map_principles_to_behaviors()
+        
+        # Observed scores (principles x behaviors, NaN-padded), set by analyze()
+        self._scores = None
         
-    def _load_principles(self) -> Dict[str, str]:
+    def _load_principles(self) -> Mapping[str, str]:
         """Load constitutional principles from source."""
         # In a real implementation, this would parse a JSON file
-        # For demonstration, we'll hardcode some example principles
-        return {
-            "transparency": "We believe that ensuring the safety of AI systems requires appropriate transparency and openness.",
-            "collaboration": "We believe progress on AI safety requires collaboration across organizations.",
-            "epistemic_humility": "We acknowledge uncertainty and avoid overconfidence in our safety claims.",
-            "safety_prioritization": "We prioritize safety considerations in our research and deployment decisions."
-        }
+        # For demonstration, we'll use the example principles
+        return _PRINCIPLES
         
     def configure(self, data_sources: Dict[str, List[str]]) -> None:
         """
@@ -67,329 +316,370 @@ class RegulatoryMirror:
         """
         print(f"Analyzing {self.organization} with trace depth: {self.trace_depth}")
         
-        # Step 1: Map constitutional principles to expected behaviors
-        principle_behaviors = self._map_principles_to_behaviors()
-        
-        # Step 2: Analyze actual organizational behaviors
-        observed_behaviors = self._analyze_organizational_behaviors()
-        
-        # Step 3: Calculate attribution drift between principles and behaviors
-        attribution_drift = self._calculate_attribution_drift(
-            principle_behaviors, observed_behaviors
+        # Reuse the previous analysis when the inputs have not changed
+        key = (
+            self.organization,
+            self.trace_depth,
+            tuple((k, tuple(v)) for k, v in sorted(self.data_sources.items()))
         )
-        
-        # Step 4: Detect constitutional diffraction across contexts
-        constitutional_diffraction = self._detect_constitutional_diffraction()
-        
-        # Step 5: Analyze recursive verification depth
-        recursive_depth = self._analyze_recursive_depth()
+        cached = self._analyze_cache.get(key)
+        if cached is None:
+            # Step 1: Map constitutional principles to expected behaviors
+            principle_behaviors = self._map_principles_to_behaviors()
+            
+            # Step 2: Analyze actual organizational behaviors
+            self._scores = self._analyze_organizational_behaviors()
+            
+            # Step 3: Calculate attribution drift between principles and behaviors
+            drift_scores = _readonly(self._calculate_attribution_drift(
+                principle_behaviors, self._scores
+            ))
+            
+            # Step 4: Detect constitutional diffraction across contexts
+            diffraction = self._detect_constitutional_diffraction()
+            
+            # Step 5: Analyze recursive verification depth
+            depth = self._analyze_recursive_depth()
+            
+            # Cache only immutable metrics; the results dict is rebuilt on every call
+            cached = (drift_scores, self._calculate_coherence_score(drift_scores),
+                      diffraction, depth)
+            self._analyze_cache[key] = cached
+        drift_scores, coherence_score, diffraction, depth = cached
+        mean_diffraction, max_diffraction_principle, max_diffraction_contexts = diffraction
+        average_depth, min_depth_principle, max_depth_principle = depth
         
         # Store and return results
         self.results = {
             "organization": self.organization,
             "principles_analyzed": list(self.principles.keys()),
-            "attribution_drift": attribution_drift,
-            "constitutional_diffraction": constitutional_diffraction,
-            "recursive_depth": recursive_depth,
-            "coherence_score": self._calculate_coherence_score(attribution_drift),
-            "drift_detected": any(score < 0.7 for score in attribution_drift.values()),
-            "consistency_score": 1.0 - constitutional_diffraction["mean_diffraction"]
+            "attribution_drift": dict(zip(self._principles_ordered, drift_scores.tolist())),
+            "constitutional_diffraction": {
+                "diffraction_data": {p: list(v) for p, v in _DIFFRACTION_DATA.items()},
+                "contexts": list(_CONTEXTS),
+                "mean_diffraction": mean_diffraction,
+                "max_diffraction_principle": max_diffraction_principle,
+                "max_diffraction_contexts": list(max_diffraction_contexts)
+            },
+            "recursive_depth": {
+                "recursive_depths": dict(_RECURSIVE_DEPTHS),
+                "average_depth": average_depth,
+                "min_depth_principle": min_depth_principle,
+                "max_depth_principle": max_depth_principle
+            },
+            "coherence_score": coherence_score,
+            "drift_detected": bool((drift_scores < 0.7).any()),
+            "consistency_score": 1.0 - mean_diffraction
         }
         
         return self.results
     
-    def _map_principles_to_behaviors(self) -> Dict[str, List[str]]:
+    @property
+    def observed_behaviors_dict(self) -> Dict[str, Dict[str, float]]:
+        """Observed behavior scores as a nested {principle: {behavior: score}} dict."""
+        if self._scores is None:
+            return {}
+        return {
+            p: {b: float(self._scores[i, j]) for j, b in enumerate(self._behaviors[p])}
+            for i, p in enumerate(self._principles_ordered)
+        }
+    
+    def _map_principles_to_behaviors(self) -> Mapping[str, Tuple[str, ...]]:
         """Map constitutional principles to expected organizational behaviors."""
         # In a real implementation, this would use a more sophisticated mapping
-        principle_behaviors = {
-            "transparency": [
-                "Publishing research openly",
-                "Providing model documentation",
-                "Engaging with external researchers",
-                "Releasing interpretability tools"
-            ],
-            "collaboration": [
-                "Partnering with external organizations",
-                "Supporting external research",
-                "Sharing safety techniques",
-                "Acknowledging external contributions"
-            ],
-            "epistemic_humility": [
-                "Acknowledging limitations",
-                "Considering alternative viewpoints",
-                "Responding to criticism constructively",
-                "Updating based on new evidence"
-            ],
-            "safety_prioritization": [
-                "Conducting thorough safety evaluations",
-                "Limiting deployment when risks are uncertain",
-                "Investing in safety research",
-                "Creating safety-focused governance"
-            ]
-        }
-        return principle_behaviors
+        return _PRINCIPLE_BEHAVIORS
     
-    def _analyze_organizational_behaviors(self) -> Dict[str, Dict[str, float]]:
-        """Analyze actual organizational behaviors from data sources."""
+    def _analyze_organizational_behaviors(self) -> np.ndarray:
+        """
+        Analyze actual organizational behaviors from data sources.
+        
+        Returns:
+            Score matrix of shape (principles, max behaviors), in principle
+            and behavior order; principles with fewer behaviors are padded
+            with NaN
+        """
         # In a real implementation, this would analyze actual data
         # For demonstration, we'll simulate behavior scores
         
         # Simulated behavior scores (0.0 to 1.0, higher = better alignment)
-        observed_behaviors = {
-            "transparency": {
-                "Publishing research openly": 0.85,
-                "Providing model documentation": 0.78,
-                "Engaging with external researchers": 0.42,
-                "Releasing interpretability tools": 0.38
-            },
-            "collaboration": {
-                "Partnering with external organizations": 0.82,
-                "Supporting external research": 0.56,
-                "Sharing safety techniques": 0.73,
-                "Acknowledging external contributions": 0.45
-            },
-            "epistemic_humility": {
-                "Acknowledging limitations": 0.80,
-                "Considering alternative viewpoints": 0.65,
-                "Responding to criticism constructively": 0.52,
-                "Updating based on new evidence": 0.70
-            },
-            "safety_prioritization": {
-                "Conducting thorough safety evaluations": 0.92,
-                "Limiting deployment when risks are uncertain": 0.88,
-                "Investing in safety research": 0.95,
-                "Creating safety-focused governance": 0.83
-            }
-        }
-        return observed_behaviors
+        return _SCORES_ARRAY
     
     def _calculate_attribution_drift(
         self, 
         principle_behaviors: Dict[str, List[str]],
-        observed_behaviors: Dict[str, Dict[str, float]]
-    ) -> Dict[str, float]:
+        observed_scores: np.ndarray
+    ) -> np.ndarray:
         """Calculate attribution drift between principles and behaviors."""
-        attribution_drift = {}
-        
-        for principle, behaviors in principle_behaviors.items():
-            behavior_scores = [observed_behaviors[principle][b] for b in behaviors]
-            attribution_drift[principle] = sum(behavior_scores) / len(behavior_scores)
-            
-        return attribution_drift
+        # Mean observed score across each principle's expected behaviors
+        return _drift_kernel(observed_scores)
     
-    def _detect_constitutional_diffraction(self) -> Dict[str, Any]:
-        """Detect constitutional diffraction across contexts."""
+    def _detect_constitutional_diffraction(self) -> Tuple[float, str, Tuple[str, str]]:
+        """
+        Detect constitutional diffraction across contexts.
+        
+        Returns:
+            Mean diffraction, the principle with the widest spread, and the
+            contexts at either end of that spread
+        """
         # In a real implementation, this would analyze actual diffraction patterns
         # For demonstration, we'll simulate diffraction data
         
-        # Simulated diffraction data across different contexts
-        contexts = ["Public Communication", "Internal Practices", "External Engagement"]
-        
-        # Simulated principle interpretation consistency (1.0 = perfectly consistent)
-        diffraction_data = {
-            "transparency": [0.92, 0.68, 0.45],
-            "collaboration": [0.88, 0.72, 0.53],
-            "epistemic_humility": [0.85, 0.70, 0.60],
-            "safety_prioritization": [0.95, 0.85, 0.78]
-        }
-        
-        # Calculate diffraction metrics
-        mean_diffraction = 1.0 - (sum([
-            sum([abs(diffraction_data[p][i] - diffraction_data[p][j]) 
-                for i in range(len(contexts)) 
-                for j in range(i+1, len(contexts))
-            ]) / (len(contexts) * (len(contexts) - 1) / 2)
-            for p in diffraction_data.keys()
-        ]) / len(diffraction_data))
+        # Simulated principle interpretation consistency across contexts
+        contexts = list(_CONTEXTS)
+        principles = list(_DIFFRACTION_DATA)
+        consistency = _D_ARRAY
         
-        max_diffraction_principle = max(diffraction_data.keys(), 
-                                        key=lambda p: max(diffraction_data[p]) - min(diffraction_data[p]))
+        # Mean absolute difference over all context pairs, per principle
+        mean_diffraction = float(_diffraction_kernel(consistency, _TRIU_I, _TRIU_J).mean())
         
-        max_diffraction_contexts = [
-            contexts[diffraction_data[max_diffraction_principle].index(max(diffraction_data[max_diffraction_principle]))],
-            contexts[diffraction_data[max_diffraction_principle].index(min(diffraction_data[max_diffraction_principle]))]
-        ]
+        # Principle with the widest spread, and the contexts at either end
+        ranges = consistency.max(axis=1) - consistency.min(axis=1)
+        p_idx = int(ranges.argmax())
+        max_diffraction_contexts = (
+            contexts[int(consistency[p_idx].argmax())],
+            contexts[int(consistency[p_idx].argmin())]
+        )
         
-        return {
-            "diffraction_data": diffraction_data,
-            "contexts": contexts,
-            "mean_diffraction": 1.0 - mean_diffraction,
-            "max_diffraction_principle": max_diffraction_principle,
-            "max_diffraction_contexts": max_diffraction_contexts
-        }
+        return mean_diffraction, principles[p_idx], max_diffraction_contexts
     
-    def _analyze_recursive_depth(self) -> Dict[str, Any]:
-        """Analyze recursive verification depth of principles."""
+    def _analyze_recursive_depth(self) -> Tuple[float, str, str]:
+        """
+        Analyze recursive verification depth of principles.
+        
+        Returns:
+            Average depth, and the principles with the lowest and highest depth
+        """
         # In a real implementation, this would test recursive application
         # For demonstration, we'll simulate recursive depth data
         
-        # Simulated recursive application depths (how many levels of recursion before principle breaks)
-        recursive_depths = {
-            "transparency": 2,  # Breaks at level 2 (org reviewing itself)
-            "collaboration": 1,  # Breaks at level 1 (applying to external researchers)
-            "epistemic_humility": 3,  # Holds through level 3
-            "safety_prioritization": 4   # Holds through level 4
-        }
+        # Simulated recursive application depths (how many levels of recursion
+        # before principle breaks), laid out in _DEPTH_ARRAY
+        average_depth = float(_DEPTH_ARRAY.mean())
+        min_depth_principle = _PRINCIPLES_ORDERED[int(_DEPTH_ARRAY.argmin())]
         
-        average_depth = sum(recursive_depths.values()) / len(recursive_depths)
-        min_depth_principle = min(recursive_depths.keys(), key=lambda p: recursive_depths[p])
+        return (
+            average_depth,
+            min_depth_principle,
+            _PRINCIPLES_ORDERED[int(_DEPTH_ARRAY.argmax())]
+        )
+    
+    def analyze_batch(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Calculate attribution drift for many organizations at once.
         
-        return {
-            "recursive_depths": recursive_depths,
-            "average_depth": average_depth,
-            "min_depth_principle": min_depth_principle,
-            "max_depth_principle": max(recursive_depths.keys(), key=lambda p: recursive_depths[p])
-        }
+        Args:
+            scores: Observed scores of shape (organizations, principles,
+                behaviors), with rows laid out like this mirror's principles
+                and NaN padding for missing behaviors
+            
+        Returns:
+            Drift scores of shape (organizations, principles)
+        """
+        scores = np.ascontiguousarray(scores, dtype=np.float64)
+        if scores.ndim != 3 or scores.shape[1] != len(self._principles_ordered):
+            raise ValueError(
+                f"Expected scores of shape (organizations, {len(self._principles_ordered)}, behaviors), "
+                f"got {scores.shape}"
+            )
+        return _batch_drift_kernel(scores)
     
-    def _calculate_coherence_score(self, attribution_drift: Dict[str, float]) -> float:
+    def _calculate_coherence_score(self, drift_scores: np.ndarray) -> float:
         """Calculate overall constitutional coherence score."""
-        return sum(attribution_drift.values()) / len(attribution_drift)
+        return float(_coherence_kernel(drift_scores))
     
-    def visualize_attribution_drift(self, output_path: Optional[str] = None) -> None:
+    def visualize_attribution_drift(self, 
+                                    output_path: Optional[str] = None,
+                                    ax: Optional["Axes"] = None) -> None:
         """
         Visualize attribution drift between principles and behaviors.
         
         Args:
             output_path: Path to save visualization (if None, will display)
+            ax: Axes to draw on (if given, saving or displaying is left to the caller)
+            
+        Raises:
+            NotAnalyzedError: If analyze() has not been run
         """
         if self.results is None:
-            print("Please run analyze() before visualization")
-            return
+            raise NotAnalyzedError("Please run analyze() before visualization")
+        
+        import matplotlib.pyplot as plt
         
         # Set up the visualization
-        plt.figure(figsize=(12, 8))
+        fig = None
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 8))
         
         # Extract principles and drift scores
         principles = list(self.results["attribution_drift"].keys())
         drift_scores = list(self.results["attribution_drift"].values())
         
         # Create color mapping based on scores
-        colors = plt.cm.RdYlGn(np.array(drift_scores))
+        colors = _get_cmap(self._RDYLGN)(np.asarray(drift_scores, dtype=np.float64))
         
         # Create bar chart
-        bars = plt.bar(principles, drift_scores, color=colors)
+        bars = ax.bar(principles, drift_scores, color=colors)
         
         # Add labels and formatting
-        plt.ylim(0, 1.0)
-        plt.xlabel('Constitutional Principles')
-        plt.ylabel('Alignment Score (higher is better)')
-        plt.title(f'Constitutional Alignment Analysis: {self.organization}')
+        ax.set_ylim(0, 1.0)
+        ax.set_xlabel('Constitutional Principles')
+        ax.set_ylabel('Alignment Score (higher is better)')
+        ax.set_title(f'Constitutional Alignment Analysis: {self.organization}')
         
         # Add score labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.02,
-                    f'{height:.2f}', ha='center', va='bottom')
+        ax.bar_label(bars, labels=[f'{score:.2f}' for score in drift_scores], padding=3)
         
         # Add threshold line
-        plt.axhline(y=0.7, color='r', linestyle='--', alpha=0.7, label='Alignment Threshold')
-        plt.legend()
-        
-        plt.tight_layout()
+        ax.axhline(y=0.7, color='r', linestyle='--', alpha=0.7, label='Alignment Threshold')
+        ax.legend()
         
-        # Save or display
-        if output_path:
-            plt.savefig(output_path)
-            print(f"Visualization saved to {output_path}")
-        else:
-            plt.show()
+        if fig is not None:
+            _save_or_show(fig, output_path)
     
-    def visualize_constitutional_diffraction(self, output_path: Optional[str] = None) -> None:
+    def visualize_constitutional_diffraction(self, 
+                                             output_path: Optional[str] = None,
+                                             ax: Optional["Axes"] = None) -> None:
         """
         Visualize constitutional diffraction across contexts.
         
         Args:
             output_path: Path to save visualization (if None, will display)
+            ax: Axes to draw on (if given, saving or displaying is left to the caller)
+            
+        Raises:
+            NotAnalyzedError: If analyze() has not been run
         """
         if self.results is None:
-            print("Please run analyze() before visualization")
-            return
+            raise NotAnalyzedError("Please run analyze() before visualization")
+        
+        import matplotlib.pyplot as plt
         
         # Extract diffraction data
         diffraction_data = self.results["constitutional_diffraction"]["diffraction_data"]
         contexts = self.results["constitutional_diffraction"]["contexts"]
         
-        # Create DataFrame for heatmap
-        df = pd.DataFrame(diffraction_data, index=contexts)
+        # Consistency as (contexts, principles)
+        principles = list(diffraction_data)
+        consistency = np.array([diffraction_data[p] for p in principles]).T
         
         # Set up the visualization
-        plt.figure(figsize=(12, 8))
+        fig = None
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 8))
         
         # Create heatmap
-        sns.heatmap(df, annot=True, cmap="RdYlGn", vmin=0.0, vmax=1.0, 
-                    linewidths=.5, cbar_kws={"label": "Principle Consistency Score"})
-        
-        plt.title(f'Constitutional Diffraction Analysis: {self.organization}')
-        plt.tight_layout()
-        
-        # Save or display
-        if output_path:
-            plt.savefig(output_path)
-            print(f"Visualization saved to {output_path}")
-        else:
-            plt.show()
+        im = ax.imshow(consistency, cmap=self._RDYLGN, vmin=0.0, vmax=1.0, aspect="auto")
+        ax.figure.colorbar(im, ax=ax, label="Principle Consistency Score")
+        ax.set_xticks(np.arange(len(principles)))
+        ax.set_xticklabels(principles)
+        ax.set_yticks(np.arange(len(contexts)))
+        ax.set_yticklabels(contexts)
+        
+        # Separate cells with thin white grid lines
+        ax.set_xticks(np.arange(len(principles) + 1) - 0.5, minor=True)
+        ax.set_yticks(np.arange(len(contexts) + 1) - 0.5, minor=True)
+        ax.grid(which="minor", color="white", linewidth=0.5)
+        ax.tick_params(which="minor", length=0)
+        
+        # Annotate cells, using light text on dark colors
+        luminance = _get_cmap(self._RDYLGN)(consistency)[..., :3] @ np.array([0.299, 0.587, 0.114])
+        for (i, j), value in np.ndenumerate(consistency):
+            ax.text(j, i, f"{value:.2f}", ha="center", va="center",
+                    color="white" if luminance[i, j] < 0.5 else "black")
+        
+        ax.set_title(f'Constitutional Diffraction Analysis: {self.organization}')
+        
+        if fig is not None:
+            _save_or_show(fig, output_path)
     
-    def visualize_recursive_depth(self, output_path: Optional[str] = None) -> None:
+    def visualize_recursive_depth(self, 
+                                  output_path: Optional[str] = None,
+                                  ax: Optional["Axes"] = None) -> None:
         """
         Visualize recursive verification depth of principles.
         
         Args:
             output_path: Path to save visualization (if None, will display)
+            ax: Axes to draw on (if given, saving or displaying is left to the caller)
+            
+        Raises:
+            NotAnalyzedError: If analyze() has not been run
         """
         if self.results is None:
-            print("Please run analyze() before visualization")
-            return
+            raise NotAnalyzedError("Please run analyze() before visualization")
+        
+        import matplotlib.pyplot as plt
         
         # Extract recursive depth data
         recursive_depths = self.results["recursive_depth"]["recursive_depths"]
         
         # Set up the visualization
-        plt.figure(figsize=(12, 8))
+        fig = None
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 8))
         
         # Create stepped visualization (like stacked depth)
         principles = list(recursive_depths.keys())
         depths = list(recursive_depths.values())
         
         # Color gradient based on depth
-        colors = plt.cm.viridis(np.array(depths) / max(depths))
+        colors = _get_cmap(self._VIRIDIS)(np.asarray(depths, dtype=np.float64) / max(depths))
         
         # Create bar chart
-        bars = plt.bar(principles, depths, color=colors)
+        bars = ax.bar(principles, depths, color=colors)
         
         # Add labels and formatting
-        plt.ylim(0, max(depths) + 1)
-        plt.xlabel('Constitutional Principles')
-        plt.ylabel('Recursive Verification Depth')
-        plt.title(f'Recursive Principle Application: {self.organization}')
+        ax.set_ylim(0, max(depths) + 1)
+        ax.set_xlabel('Constitutional Principles')
+        ax.set_ylabel('Recursive Verification Depth')
+        ax.set_title(f'Recursive Principle Application: {self.organization}')
         
         # Add recursive level labels for context
-        for i, level in enumerate(["Direct Application", 
-                                 "Self-Application", 
-                                 "Organizational Review", 
-                                 "External Audit", 
-                                 "Meta-Analysis"]):
-            if i <= max(depths):
-                plt.axhline(y=i+0.5, color='gray', linestyle=':', alpha=0.5)
-                plt.text(len(principles)-0.9, i+0.6, f"Level {i+1}: {level}", 
-                        ha='right', va='bottom', alpha=0.7)
+        levels = ["Direct Application", 
+                  "Self-Application", 
+                  "Organizational Review", 
+                  "External Audit", 
+                  "Meta-Analysis"][:max(depths) + 1]
+        level_y = np.arange(len(levels)) + 0.5
+        ax.hlines(level_y, 0, 1, transform=ax.get_yaxis_transform(),
+                  colors='gray', linestyles=':', alpha=0.5)
+        for i, level in enumerate(levels):
+            ax.text(len(principles)-0.9, i+0.6, f"Level {i+1}: {level}", 
+                    ha='right', va='bottom', alpha=0.7)
         
         # Add depth labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{height}', ha='center', va='bottom')
-        
-        plt.tight_layout()
-        
-        # Save or display
-        if output_path:
-            plt.savefig(output_path)
-            print(f"Visualization saved to {output_path}")
-        else:
-            plt.show()
+        ax.bar_label(bars, fmt='%d', padding=3)
+        
+        if fig is not None:
+            _save_or_show(fig, output_path)
+    
+    def visualize_all(self, output_path: Optional[str] = None) -> None:
+        """
+        Draw the attribution drift, diffraction and recursive depth views side by side.
+        
+        Args:
+            output_path: Path to save visualization (if None, will display)
+            
+        Raises:
+            NotAnalyzedError: If analyze() has not been run
+        """
+        if self.results is None:
+            raise NotAnalyzedError("Please run analyze() before visualization")
+        
+        import matplotlib.pyplot as plt
+        
+        fig, axes = plt.subplots(1, 3, figsize=(30, 8))
+        self.visualize_attribution_drift(ax=axes[0])
+        self.visualize_constitutional_diffraction(ax=axes[1])
+        self.visualize_recursive_depth(ax=axes[2])
+        _save_or_show(fig, output_path)
 
 # Example usage of the RegulatoryMirror class
 if __name__ == "__main__":
+    import matplotlib
+    # Scripted runs only write image files, so skip interactive backend setup
+    matplotlib.use("Agg")
+    
     # Initialize the regulatory mirror for Anthropic
     mirror = RegulatoryMirror(
         organization="Anthropic",